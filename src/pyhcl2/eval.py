@@ -3,7 +3,8 @@ from __future__ import annotations
 import re
 from collections.abc import Callable, Iterable, Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import Self
+from types import MappingProxyType
+from typing import Any, ClassVar, cast
 
 from pyagnostics.exceptions import DiagnosticError
 from pyagnostics.spans import LabeledSpan, SourceSpan
@@ -11,6 +12,8 @@ from rich.console import Group
 from rich.text import Text
 
 from pyhcl2.nodes import (
+    NODE_KIND_ATTRIBUTE,
+    NODE_KIND_BLOCK,
     ArrayExpression,
     Attribute,
     AttrSplat,
@@ -37,17 +40,106 @@ from pyhcl2.values import Array, Boolean, Integer, Null, Object, String, Unknown
 
 camel_to_snake_pattern = re.compile(r"(?<!^)(?=[A-Z])")
 
+ForIterator = Callable[[Value], Iterable[tuple[Value, Value]]]
+KeyGetter = Callable[[Value, SourceSpan, Any, "EvaluationScope"], Value]
+
+
+def _iter_object(collection: Value) -> Iterable[tuple[Value, Value]]:
+    return cast(Object, collection).items()
+
+
+def _iter_array(collection: Value) -> Iterable[tuple[Value, Value]]:
+    return [(Integer(k), v) for k, v in enumerate(cast(Array, collection))]
+
+
+def _iter_unknown(collection: Value) -> Iterable[tuple[Value, Value]]:
+    unknown = cast(Unknown, collection).indirect()
+    return ((unknown, unknown),)
+
+
+def _indirect_if_unknown(value: Value) -> Value:
+    if isinstance(value, Unknown):
+        return value.indirect()
+    return value
+
+
+def _splat_elements(on: Value) -> list[Value] | None:
+    """The elements a splat is applied to, or None when splatting null.
+
+    The exact type is checked first so the common array case avoids the
+    class pattern match.
+    """
+    on_type = type(on)
+    if on_type is Array:
+        return cast(Array, on)._raw
+    if on_type is Null:
+        return None
+
+    match on:
+        case Null():
+            return None
+        case Array(array):
+            return array
+        case _:
+            return [on]
+
+
+_FOR_ITERATORS: dict[type[Value], ForIterator | None] = {
+    Object: _iter_object,
+    Array: _iter_array,
+    Unknown: _iter_unknown,
+}
+
+
+def _for_iterator(collection: Value) -> ForIterator | None:
+    """Returns the iterator used by for expressions over the given collection.
+
+    Lookups are keyed on the exact type of the collection, subclasses are
+    resolved once and memoized.
+    """
+    try:
+        return _FOR_ITERATORS[type(collection)]
+    except KeyError:
+        pass
+
+    iterator: ForIterator | None = None
+    match collection:
+        case Object():
+            iterator = _iter_object
+        case Array():
+            iterator = _iter_array
+        case Unknown():
+            iterator = _iter_unknown
+
+    _FOR_ITERATORS[type(collection)] = iterator
+    return iterator
+
+
+_NO_VARIABLES: Mapping[str, Value] = MappingProxyType({})
+
 
-@dataclass
 class EvaluationScope:
-    parent: Self | None = None
-    variables: MutableMapping[str, Value] = field(default_factory=dict)
+    __slots__ = ("parent", "variables")
+
+    def __init__(
+        self,
+        parent: EvaluationScope | None = None,
+        variables: MutableMapping[str, Value] | None = None,
+    ) -> None:
+        self.parent = parent
+        # Scopes that are never written to share an empty mapping, the dict is
+        # only allocated on the first write.
+        self.variables: Mapping[str, Value] = (
+            _NO_VARIABLES if variables is None else variables
+        )
 
-    def __post_init__(self) -> None:
         for key, value in self.variables.items():
             if not isinstance(value, Value):
                 raise TypeError(f"Variable {key} is not a Value")
 
+    def __repr__(self) -> str:
+        return f"EvaluationScope(parent={self.parent!r}, variables={self.variables!r})"
+
     def __getitem__(self, item: str) -> Value:
         try:
             return self.variables[item]
@@ -58,13 +150,16 @@ class EvaluationScope:
         raise KeyError(f"Variable {item} not set")
 
     def __setitem__(self, key: str, value: Value) -> None:
-        self.variables[key] = value
-
-    def __contains__(self, item: Value) -> bool:
-        if item in self.variables:
-            return True
-        if self.parent:
-            return item in self.parent
+        if self.variables is _NO_VARIABLES:
+            self.variables = {}
+        cast(MutableMapping[str, Value], self.variables)[key] = value
+
+    def __contains__(self, item: str) -> bool:
+        scope: EvaluationScope | None = self
+        while scope is not None:
+            if item in scope.variables:
+                return True
+            scope = scope.parent
         return False
 
     def child(self) -> EvaluationScope:
@@ -77,50 +172,60 @@ class Evaluator:
         default_factory=dict
     )
 
-    def eval(self, expr: Node, scope: EvaluationScope = EvaluationScope()) -> Value:  # noqa: PLR0912
-        match expr:
-            case Block() as expr:
-                result = self._eval_block(expr, scope)
-            case Literal() as expr:
-                result = self._eval_literal(expr, scope)
-            case ArrayExpression() as expr:
-                result = self._eval_array_expression(expr, scope)
-            case ObjectExpression() as expr:
-                result = self._eval_object_expression(expr, scope)
-            case Identifier() as expr:
-                result = self._eval_identifier(expr, scope)
-            case Parenthesis() as expr:
-                result = self._eval_parenthesis(expr, scope)
-            case BinaryExpression() as expr:
-                result = self._eval_binary_expression(expr, scope)
-            case UnaryExpression() as expr:
-                result = self._eval_unary_expression(expr, scope)
-            case Attribute() as expr:
-                result = self._eval_attribute(expr, scope)
-            case GetAttr() as expr:
-                result = self._eval_get_attr(expr, scope)
-            case GetIndex() as expr:
-                result = self._eval_get_index(expr, scope)
-            case FunctionCall() as expr:
-                result = self._eval_function_call(expr, scope)
-            case Conditional() as expr:
-                result = self._eval_conditional(expr, scope)
-            case ForTupleExpression() as expr:
-                result = self._eval_for_tuple_expression(expr, scope)
-            case ForObjectExpression() as expr:
-                result = self._eval_for_object_expression(expr, scope)
-            case AttrSplat() as expr:
-                result = self._eval_attr_splat(expr, scope)
-            case IndexSplat() as expr:
-                result = self._eval_index_splat(expr, scope)
-            case _:
-                raise DiagnosticError(
-                    code="pyhcl2::evaluator::unsupported_node",
-                    message=f"Unsupported node type {expr.__class__.__name__}",
-                    labels=[
-                        LabeledSpan(expr.span, "unsupported expression"),
-                    ],
-                )
+    _BINARY_OPERATIONS: ClassVar[dict[str, str]] = {
+        "+": "__add__",
+        "-": "__sub__",
+        "*": "__mul__",
+        "/": "__truediv__",
+        "%": "__mod__",
+        "==": "__equals__",
+        "!=": "__not_equals__",
+        "<": "__lt__",
+        ">": "__gt__",
+        "<=": "__le__",
+        ">=": "__ge__",
+        "&&": "__and__",
+        "||": "__or__",
+    }
+    _UNARY_OPERATIONS: ClassVar[dict[str, str]] = {
+        "-": "__neg__",
+        "!": "__not__",
+    }
+
+    def __post_init__(self) -> None:
+        # Node classes are final, so an exact-type lookup replaces walking a
+        # match ladder on every visit
+        self._dispatch: dict[type[Node], Callable[[Any, EvaluationScope], Value]] = {
+            Block: self._eval_block,
+            Literal: self._eval_literal,
+            ArrayExpression: self._eval_array_expression,
+            ObjectExpression: self._eval_object_expression,
+            Identifier: self._eval_identifier,
+            Parenthesis: self._eval_parenthesis,
+            BinaryExpression: self._eval_binary_expression,
+            UnaryExpression: self._eval_unary_expression,
+            Attribute: self._eval_attribute,
+            GetAttr: self._eval_get_attr,
+            GetIndex: self._eval_get_index,
+            FunctionCall: self._eval_function_call,
+            Conditional: self._eval_conditional,
+            ForTupleExpression: self._eval_for_tuple_expression,
+            ForObjectExpression: self._eval_for_object_expression,
+            AttrSplat: self._eval_attr_splat,
+            IndexSplat: self._eval_index_splat,
+        }
+
+    def eval(self, expr: Node, scope: EvaluationScope = EvaluationScope()) -> Value:
+        handler = self._dispatch.get(type(expr))
+        if handler is None:
+            raise DiagnosticError(
+                code="pyhcl2::evaluator::unsupported_node",
+                message=f"Unsupported node type {expr.__class__.__name__}",
+                labels=[
+                    LabeledSpan(expr.span, "unsupported expression"),
+                ],
+            )
+        result = handler(expr, scope)
 
         # rich.print(Inline(Text("eval", style=STYLE_FUNCTION), "(", expr, "):  ", result, NewLine()))
         if result.span is None:
@@ -129,53 +234,66 @@ class Evaluator:
 
     def _eval_block(self, block: Block, scope: EvaluationScope) -> Value:
         result: dict[String, Value] = {}
+        # Every statement is evaluated in its own child scope, so attributes
+        # bound by one statement are not visible to its siblings.
+        child = scope.child
+        eval_ = self.eval
 
         for stmt in block.body:
-            match stmt:
-                case Attribute() as attr:
-                    key = attr.key.as_string()
-                    value = self.eval(stmt, scope.child())
+            kind = stmt.NODE_KIND
+            if kind == NODE_KIND_ATTRIBUTE:
+                attr = cast(Attribute, stmt)
+                key = attr.key.as_string()
+                value = eval_(attr, child())
 
-                    if key in result:
-                        raise DiagnosticError(
-                            code="pyhcl2::evaluator::block::duplicate_key",
-                            message="Duplicate key in block",
-                            labels=[LabeledSpan(attr.key.span, "duplicate key")],
-                        )
+                if key in result:
+                    raise DiagnosticError(
+                        code="pyhcl2::evaluator::block::duplicate_key",
+                        message="Duplicate key in block",
+                        labels=[LabeledSpan(attr.key.span, "duplicate key")],
+                    )
 
-                    result[key] = value
+                result[key] = value
 
-                case Block() as block:
-                    keys = block.keys
-                    value = self.eval(block, scope.child())
+            elif kind == NODE_KIND_BLOCK:
+                nested = cast(Block, stmt)
+                self._insert_block_value(result, nested, eval_(nested, child()))
 
-                    mapping: MutableMapping[String, Value] = result
-                    for key in keys[:-1]:
-                        match mapping.get(key, None):
-                            case None:
-                                mapping = mapping[key] = Object({})
-                            case Object() as obj:
-                                mapping = obj
-                            case _:
-                                raise DiagnosticError(
-                                    code="pyhcl2::evaluator::block::key_conflict",
-                                    message="Key conflict in block",
-                                    labels=[LabeledSpan(block.span, "key conflict")],
-                                )
+        return Object(result)
 
-                    match mapping.get(keys[-1], None):
-                        case None:
-                            mapping[keys[-1]] = Array([value])
-                        case Array() as array:
-                            array.append(value)
-                        case _:
-                            raise DiagnosticError(
-                                code="pyhcl2::evaluator::block::key_conflict",
-                                message="Key conflict in block",
-                                labels=[LabeledSpan(block.span, "key conflict")],
-                            )
+    @staticmethod
+    def _insert_block_value(
+        result: MutableMapping[String, Value], block: Block, value: Value
+    ) -> None:
+        # block.keys is cached on the node, so re-evaluating the same block only
+        # walks the already built key path.
+        *path, last = block.keys
+
+        mapping = result
+        for key in path:
+            match mapping.get(key, None):
+                case None:
+                    mapping = mapping[key] = Object({})
+                case Object() as obj:
+                    mapping = obj
+                case _:
+                    raise DiagnosticError(
+                        code="pyhcl2::evaluator::block::key_conflict",
+                        message="Key conflict in block",
+                        labels=[LabeledSpan(block.span, "key conflict")],
+                    )
 
-        return Object(result)
+        match mapping.get(last, None):
+            case None:
+                mapping[last] = Array([value])
+            case Array() as array:
+                array.append(value)
+            case _:
+                raise DiagnosticError(
+                    code="pyhcl2::evaluator::block::key_conflict",
+                    message="Key conflict in block",
+                    labels=[LabeledSpan(block.span, "key conflict")],
+                )
 
     @staticmethod
     def _eval_literal(expr: Literal, _scope: EvaluationScope) -> Value:
@@ -184,53 +302,63 @@ class Evaluator:
     def _eval_array_expression(
         self, expr: ArrayExpression, scope: EvaluationScope
     ) -> Value:
-        return Array([self.eval(item, scope) for item in expr.values])
+        literal_values = expr.literal_values
+        if literal_values is not None:
+            return Array(list(literal_values))
+
+        eval_ = self.eval
+        return Array([eval_(item, scope) for item in expr.values])
 
     def _eval_object_expression(
         self, obj: ObjectExpression, scope: EvaluationScope
     ) -> Value:
+        literal_fields = obj.literal_fields
+        if literal_fields is not None:
+            return Object(dict(literal_fields))
+
         result: dict[String, Value] = {}
 
         unknown_keys = []
 
-        for key_expr, value_expr in obj.fields.items():
+        for static_key, (key_expr, value_expr) in zip(
+            obj.static_keys, obj.fields, strict=True
+        ):
             resolved_key: String
-            match key_expr:
-                case Identifier(name):
-                    resolved_key = String(name)
-                case Literal(String() as string):
-                    resolved_key = string
-                case Parenthesis(expr):
-                    key = self.eval(expr, scope)
-
-                    match key:
-                        case Unknown() as key:
-                            unknown_keys.append(key)
-                            continue
-                        case String() as key:
-                            resolved_key = key
-                        case _:
-                            raise DiagnosticError(
-                                code="pyhcl2::evaluator::object::unsupported_key",
-                                message="Unsupported key type in object",
-                                labels=[LabeledSpan(expr.span, key.type_name)],
-                            )
-                case _:
-                    raise DiagnosticError(
-                        code="pyhcl2::evaluator::object::unsupported_key",
-                        message="Unsupported key type in object",
-                        labels=[LabeledSpan(key_expr.span, "unsupported key")],
-                        notes=[
-                            Inline(
-                                "[blue]help:[/blue] ",
-                                "Did you mean `",
-                                Parenthesis(key_expr),
-                                " = ",
-                                value_expr,
-                                "`?",
-                            )
-                        ],
-                    )
+            if static_key is not None:
+                resolved_key = static_key
+            else:
+                match key_expr:
+                    case Parenthesis(expr):
+                        key = self.eval(expr, scope)
+
+                        match key:
+                            case Unknown() as key:
+                                unknown_keys.append(key)
+                                continue
+                            case String() as key:
+                                resolved_key = key
+                            case _:
+                                raise DiagnosticError(
+                                    code="pyhcl2::evaluator::object::unsupported_key",
+                                    message="Unsupported key type in object",
+                                    labels=[LabeledSpan(expr.span, key.type_name)],
+                                )
+                    case _:
+                        raise DiagnosticError(
+                            code="pyhcl2::evaluator::object::unsupported_key",
+                            message="Unsupported key type in object",
+                            labels=[LabeledSpan(key_expr.span, "unsupported key")],
+                            notes=[
+                                Inline(
+                                    "[blue]help:[/blue] ",
+                                    "Did you mean `",
+                                    Parenthesis(key_expr),
+                                    " = ",
+                                    value_expr,
+                                    "`?",
+                                )
+                            ],
+                        )
             value = self.eval(value_expr, scope)
             if isinstance(value, Unknown):
                 value = value.indirect()
@@ -254,21 +382,7 @@ class Evaluator:
     def _eval_binary_expression(
         self, expr: BinaryExpression, scope: EvaluationScope
     ) -> Value:
-        operation = {
-            "+": "__add__",
-            "-": "__sub__",
-            "*": "__mul__",
-            "/": "__truediv__",
-            "%": "__mod__",
-            "==": "__equals__",
-            "!=": "__not_equals__",
-            "<": "__lt__",
-            ">": "__gt__",
-            "<=": "__le__",
-            ">=": "__ge__",
-            "&&": "__and__",
-            "||": "__or__",
-        }[expr.op.type]
+        operation = self._BINARY_OPERATIONS[expr.op.type]
 
         left = self.eval(expr.left, scope)
         try:
@@ -321,10 +435,7 @@ class Evaluator:
         value = self.eval(expr.expr, scope)
 
         try:
-            operation = {
-                "-": "__neg__",
-                "!": "__not__",
-            }[expr.op.type]
+            operation = self._UNARY_OPERATIONS[expr.op.type]
             result = getattr(value, operation)()
 
             if result is NotImplemented:
@@ -375,7 +486,7 @@ class Evaluator:
             )
 
         try:
-            return on[String(key_value)]
+            return on[String.intern(key_value)]
         except KeyError:
             return Unknown().direct(key.ident.span, key_value)
 
@@ -435,25 +546,27 @@ class Evaluator:
                 labels=[LabeledSpan(call.span, "call with var args")],
             )
 
-        if call.ident.name in self.intrinsic_functions:
-            args = [self.eval(arg, scope) for arg in call.args]
-            if any(isinstance(arg.resolve(), Unknown) for arg in args):
-                return Unknown.indirect(*args)
+        function = self.intrinsic_functions.get(call.ident.name)
+        if function is None:
+            raise DiagnosticError(
+                code="pyhcl2::evaluator::function_call::unsupported_function",
+                message=f"Intrinsic function `{call.ident.name}` does not exist",
+                labels=[LabeledSpan(call.ident.span, "unsupported function")],
+            )
 
-            try:
-                return self.intrinsic_functions[call.ident.name](*args)
-            except TypeError as e:
-                raise DiagnosticError(
-                    code="pyhcl2::evaluator::function_call::invalid_args",
-                    message="Invalid arguments passed to function",
-                    labels=[LabeledSpan(call.args_span, "invalid arguments")],
-                ) from e
-
-        raise DiagnosticError(
-            code="pyhcl2::evaluator::function_call::unsupported_function",
-            message=f"Intrinsic function `{call.ident.name}` does not exist",
-            labels=[LabeledSpan(call.ident.span, "unsupported function")],
-        )
+        eval_ = self.eval
+        args = [eval_(arg, scope) for arg in call.args]
+        if any(isinstance(arg.resolve(), Unknown) for arg in args):
+            return Unknown.indirect(*args)
+
+        try:
+            return function(*args)
+        except TypeError as e:
+            raise DiagnosticError(
+                code="pyhcl2::evaluator::function_call::invalid_args",
+                message="Invalid arguments passed to function",
+                labels=[LabeledSpan(call.args_span, "invalid arguments")],
+            ) from e
 
     def _eval_conditional(self, expr: Conditional, scope: EvaluationScope) -> Value:
         condition = self.eval(expr.cond, scope)
@@ -476,40 +589,51 @@ class Evaluator:
                     labels=[LabeledSpan(expr.cond.span, condition.type_name)],
                 )
 
+    @staticmethod
+    def _for_iteration_scope(
+        expr: ForTupleExpression | ForObjectExpression,
+        scope: EvaluationScope,
+        k: Value,
+        v: Value,
+    ) -> EvaluationScope:
+        child_scope = scope.child()
+        child_scope[expr.value_ident.name] = v
+        if expr.key_ident:
+            child_scope[expr.key_ident.name] = k
+        return child_scope
+
     def _eval_for_tuple_expression(
         self, expr: ForTupleExpression, scope: EvaluationScope
     ) -> Value:
         collection = self.eval(expr.collection, scope)
-        results: list[Value] = []
 
-        iterator: Iterable[tuple[Value, Value]]
+        iterate = _for_iterator(collection)
+        if iterate is None:
+            raise DiagnosticError(
+                code="pyhcl2::evaluator::for_tuple_expression::unsupported_collection",
+                message=f"Unsupported collection type {collection.type_name}",
+                labels=[LabeledSpan(expr.collection.span, collection.type_name)],
+            )
+        iterator = iterate(collection)
+
+        condition_expr = expr.condition
+        if condition_expr is None:
+            return Array(
+                [
+                    _indirect_if_unknown(
+                        self.eval(
+                            expr.value, self._for_iteration_scope(expr, scope, k, v)
+                        )
+                    )
+                    for k, v in iterator
+                ]
+            )
 
-        match collection:
-            case Object(obj):
-                iterator = obj.items()
-            case Array(array):
-                iterator = [(Integer(k), v) for k, v in enumerate(array)]
-            case Unknown() as collection:
-                unknown = collection.indirect()
-                iterator = [(unknown, unknown)]
-            case _:
-                raise DiagnosticError(
-                    code="pyhcl2::evaluator::for_tuple_expression::unsupported_collection",
-                    message=f"Unsupported collection type {collection.type_name}",
-                    labels=[LabeledSpan(expr.collection.span, collection.type_name)],
-                )
+        results: list[Value] = []
 
         for k, v in iterator:
-            child_scope = scope.child()
-            child_scope[expr.value_ident.name] = v
-            if expr.key_ident:
-                child_scope[expr.key_ident.name] = k
-
-            condition = (
-                self.eval(expr.condition, child_scope)
-                if expr.condition is not None
-                else Boolean(True)
-            )
+            child_scope = self._for_iteration_scope(expr, scope, k, v)
+            condition = self.eval(condition_expr, child_scope)
 
             match condition:
                 case Unknown() as condition:
@@ -517,25 +641,21 @@ class Evaluator:
                         Unknown.indirect(condition, self.eval(expr.value, child_scope))
                     )
                 case Boolean(True):
-                    result = self.eval(expr.value, child_scope)
-                    match result:
-                        case Unknown() as result:
-                            results.append(result.indirect())
-                        case _:
-                            results.append(result)
+                    results.append(
+                        _indirect_if_unknown(self.eval(expr.value, child_scope))
+                    )
                 case Boolean(False):
                     pass
                 case _:
-                    assert expr.condition is not None
                     raise DiagnosticError(
                         code="pyhcl2::evaluator::for_tuple_expression::unsupported_condition",
                         message=f"Unsupported condition type {condition.type_name}",
-                        labels=[LabeledSpan(expr.condition.span, condition.type_name)],
+                        labels=[LabeledSpan(condition_expr.span, condition.type_name)],
                     )
 
         return Array(results)
 
-    def _eval_for_object_expression(  # noqa: PLR0912
+    def _eval_for_object_expression(
         self, expr: ForObjectExpression, scope: EvaluationScope
     ) -> Value:
         if expr.grouping_mode:
@@ -549,28 +669,17 @@ class Evaluator:
         results: dict[String, Value] = {}
         unknown_blockers = []
 
-        iterator: Iterable[tuple[Value, Value]]
-
-        match collection:
-            case Object(obj):
-                iterator = obj.items()
-            case Array(array):
-                iterator = [(Integer(k), v) for k, v in enumerate(array)]
-            case Unknown() as collection:
-                unknown = collection.indirect()
-                iterator = [(unknown, unknown)]
-            case _:
-                raise DiagnosticError(
-                    code="pyhcl2::evaluator::for_object_expression::unsupported_collection",
-                    message=f"Unsupported collection type {collection.type_name}",
-                    labels=[LabeledSpan(expr.collection.span, collection.type_name)],
-                )
+        iterate = _for_iterator(collection)
+        if iterate is None:
+            raise DiagnosticError(
+                code="pyhcl2::evaluator::for_object_expression::unsupported_collection",
+                message=f"Unsupported collection type {collection.type_name}",
+                labels=[LabeledSpan(expr.collection.span, collection.type_name)],
+            )
+        iterator = iterate(collection)
 
         for k, v in iterator:
-            child_scope = scope.child()
-            child_scope[expr.value_ident.name] = v
-            if expr.key_ident:
-                child_scope[expr.key_ident.name] = k
+            child_scope = self._for_iteration_scope(expr, scope, k, v)
 
             condition = (
                 self.eval(expr.condition, child_scope)
@@ -619,26 +728,41 @@ class Evaluator:
 
         return Object(results)
 
+    def _compile_key_chain(
+        self, on_span: SourceSpan, keys: Iterable[GetAttrKey | GetIndexKey]
+    ) -> list[tuple[KeyGetter, GetAttrKey | GetIndexKey, SourceSpan]]:
+        """Resolves the getter and source span of each splat key once per splat.
+
+        The chain only depends on the keys, so it is shared by every element the
+        splat is applied to.
+        """
+        chain: list[tuple[KeyGetter, GetAttrKey | GetIndexKey, SourceSpan]] = []
+        span = on_span
+        for key in keys:
+            getter: KeyGetter = (
+                self._evaluate_get_attr
+                if isinstance(key, GetAttrKey)
+                else self._evaluate_get_index
+            )
+            chain.append((getter, key, span))
+            span = SourceSpan(span.start, key.span.end)
+        return chain
+
     def _eval_attr_splat(self, expr: AttrSplat, scope: EvaluationScope) -> Value:
         on = self.eval(expr.on, scope)
 
-        match on:
-            case Null():
-                return Array([])
-            case Array(array):
-                iterable = array
-            case _:
-                iterable = [on]
+        iterable = _splat_elements(on)
+        if iterable is None:
+            return Array([])
 
         values = []
+        key_chain = self._compile_key_chain(expr.on.span, expr.keys)
 
         for i, v in enumerate(iterable):
             try:
-                span = expr.on.span
                 value = v
-                for key in expr.keys:
-                    value = self._evaluate_get_attr(value, span, key, scope)
-                    span = SourceSpan(span.start, key.span.end)
+                for getter, key, span in key_chain:
+                    value = getter(value, span, key, scope)
                 values.append(value)
             except DiagnosticError as e:
                 e.notes.append(
@@ -659,27 +783,18 @@ class Evaluator:
     def _eval_index_splat(self, expr: IndexSplat, scope: EvaluationScope) -> Value:
         on = self.eval(expr.on, scope)
 
-        match on:
-            case Null():
-                return Array([])
-            case Array(array):
-                iterable = array
-            case _:
-                iterable = [on]
+        iterable = _splat_elements(on)
+        if iterable is None:
+            return Array([])
 
         values = []
+        key_chain = self._compile_key_chain(expr.on.span, expr.keys)
 
         for i, v in enumerate(iterable):
             try:
-                span = expr.on.span
                 value = v
-                for key in expr.keys:
-                    match key:
-                        case GetAttrKey():
-                            value = self._evaluate_get_attr(value, span, key, scope)
-                        case GetIndexKey():
-                            value = self._evaluate_get_index(value, span, key, scope)
-                    span = SourceSpan(span.start, key.span.end)
+                for getter, key, span in key_chain:
+                    value = getter(value, span, key, scope)
                 values.append(value)
             except DiagnosticError as e:
                 e.notes.append(
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import networkx as nx  # type: ignore
-
 from pyhcl2.nodes import Block, Module
 from pyhcl2.tracker import resolve_variable_references
 
@@ -19,19 +17,33 @@ def get_blocks_by_generation(
 def _topological_generations(blocks: list[Block]) -> list[list[Block]]:
     blocks_by_key = {block.key(): block for block in blocks}
 
-    graph = nx.DiGraph()
+    in_degree: dict[tuple[str, ...], int] = dict.fromkeys(blocks_by_key, 0)
+    dependents: dict[tuple[str, ...], list[tuple[str, ...]]] = {
+        key: [] for key in blocks_by_key
+    }
 
     for key, block_under_test in blocks_by_key.items():
-        graph.add_node(key)
         variable_references = resolve_variable_references(block_under_test)
 
         for dirty_child in variable_references:
             if dirty_child in blocks_by_key:
-                graph.add_edge(dirty_child, key)
-
-    if not nx.is_directed_acyclic_graph(graph):
+                dependents[dirty_child].append(key)
+                in_degree[key] += 1
+
+    # Kahn's algorithm, emitting every layer of zero in-degree nodes as a generation
+    generations: list[list[tuple[str, ...]]] = []
+    generation = [key for key, degree in in_degree.items() if degree == 0]
+    while generation:
+        generations.append(generation)
+        next_generation = []
+        for key in generation:
+            for dependent in dependents[key]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_generation.append(dependent)
+        generation = next_generation
+
+    if sum(len(generation) for generation in generations) != len(blocks_by_key):
         raise ValueError("Graph is not a DAG")
 
-    generations = list(nx.topological_generations(graph))
-
     return [[blocks_by_key[k] for k in generation] for generation in generations]
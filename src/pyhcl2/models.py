@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, TypeVar, cast
 
 import rich
@@ -13,85 +14,114 @@ from pyhcl2.eval import EvaluationScope, Evaluator
 from pyhcl2.nodes import Block
 from pyhcl2.parse import parse_expr_or_stmt
 from pyhcl2.rich_utils import Inline
-from pyhcl2.values import Array, Object, String, Value
+from pyhcl2.values import Array, Object, Value
 
 Model = TypeVar("Model", bound=BaseModel)
 
+_MISSING = object()
+_DEFAULT_EVALUATOR = Evaluator()
+
+
+def _child_value(value: Value, loc: int | str) -> Value | None:
+    """The value at a single validation error location component, if present."""
+    # Exact type checks: evaluation only produces plain Array/Object containers
+    kind = type(value)
+    if kind is Object:
+        return cast(Object, value).get_by_str(loc) if type(loc) is str else None
+    if kind is Array and type(loc) is int:
+        items = cast(Array, value)._raw
+        return items[loc] if -len(items) <= loc < len(items) else None
+    return None
+
+
+@lru_cache(maxsize=256)
+def _field_annotations(model_cls: type[BaseModel]) -> dict[str, Any]:
+    """Field name to annotation map, built once per model class."""
+    return {name: field.annotation for name, field in model_cls.model_fields.items()}
+
+
+def _missing_field_diagnostic(value: Value, field_key: str) -> DiagnosticError:
+    return DiagnosticError(
+        code="pyhcl2::models::validation_error",
+        message=f"Missing required field {field_key}",
+        labels=[LabeledSpan(value.span, f"{value.type_name} missing field")]
+        if value.span is not None
+        else [],
+    )
+
+
+def _validation_diagnostic(
+    value: Value, error_type: str, msg: str, ctx: object
+) -> DiagnosticError:
+    return DiagnosticError(
+        code=f"pyhcl2::pydantic_validation_error::{error_type}",
+        message=msg,
+        labels=[LabeledSpan(value.span, "invalid input")]
+        if value.span is not None
+        else [],
+        notes=[Inline("[blue]context:[/blue] ", repr(ctx))]
+        if ctx is not _MISSING
+        else [],
+    )
+
 
 # ruff: noqa: PLR0912
 def load_model_from_block(
     block: Block,
     model_cls: type[Model],
-    evaluator: Evaluator = Evaluator(),
-    scope: EvaluationScope = EvaluationScope(),
+    evaluator: Evaluator | None = None,
+    scope: EvaluationScope | None = None,
 ) -> Model:
+    if evaluator is None:
+        evaluator = _DEFAULT_EVALUATOR
+    if scope is None:
+        # A fresh scope per call, so attributes bound while evaluating one
+        # block never leak into the next.
+        scope = EvaluationScope()
+
     block_value: Object = cast(Object, evaluator.eval(block, scope))
     field_values: dict[str, Any] = {}
 
-    for k, v in block_value.items():
-        name = k.raw()
-        if name in model_cls.model_fields:
-            field = model_cls.model_fields[name]
-            if field.annotation is not None and (
-                field.annotation is type(v) or field.annotation is Value
-            ):
-                field_values[name] = v
-            else:
-                field_values[name] = v.raw()
+    annotations = _field_annotations(model_cls)
+
+    for name, v in block_value.str_items():
+        annotation = annotations.get(name, _MISSING)
+        if annotation is _MISSING:
+            continue
+        # Fields annotated with a Value type receive the value itself
+        if annotation is Value or annotation is type(v):
+            field_values[name] = v
+        else:
+            field_values[name] = v.raw()
 
     try:
         return model_cls.model_validate(field_values)
     except ValidationError as e:
         diagnostics: list[DiagnosticError] = []
+        append = diagnostics.append
+        key_prefix = block.key()
         for error in e.errors():
             error = cast(ErrorDetails, error)
+            error_loc = error["loc"]
+            error_type = error["type"]
 
             value: Value = block_value
-            try:
-                for loc in error["loc"]:
-                    match loc:
-                        case int():
-                            assert isinstance(value, Array)
-                            value = value[loc]
-                        case str():
-                            assert isinstance(value, Object)
-                            value = value[String(loc)]
-            except KeyError:
-                pass
-
-            field_key = list(block.key()) + [str(val) for val in error["loc"]]
-            field_key_str = ".".join(field_key)
-
-            match error["type"]:
-                case "missing":
-                    diagnostics.append(
-                        DiagnosticError(
-                            code="pyhcl2::models::validation_error",
-                            message=f"Missing required field {field_key_str}",
-                            labels=[
-                                LabeledSpan(
-                                    value.span, f"{value.type_name} missing field"
-                                ),
-                            ]
-                            if value.span is not None
-                            else [],
-                        )
-                    )
-                case _:
-                    diagnostics.append(
-                        DiagnosticError(
-                            code=f"pyhcl2::pydantic_validation_error::{error["type"]}",
-                            message=error["msg"],
-                            labels=[
-                                LabeledSpan(value.span, "invalid input"),
-                            ]
-                            if value.span is not None
-                            else [],
-                            notes=[Inline("[blue]context:[/blue] ", repr(error["ctx"]))]
-                            if "ctx" in error
-                            else [],
-                        )
+            for loc in error_loc:
+                child = _child_value(value, loc)
+                if child is None:
+                    break
+                value = child
+
+            field_key_str = ".".join((*key_prefix, *map(str, error_loc)))
+
+            if error_type == "missing":
+                append(_missing_field_diagnostic(value, field_key_str))
+            else:
+                append(
+                    _validation_diagnostic(
+                        value, error_type, error["msg"], error.get("ctx", _MISSING)
                     )
+                )
 
         raise DiagnosticErrorGroup("Failed to validate hcl model", diagnostics)
 
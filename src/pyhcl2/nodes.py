@@ -4,13 +4,12 @@ import dataclasses
 import typing as t
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from functools import cached_property
+from itertools import islice
 
 from pyagnostics.spans import SourceSpan
 from rich.console import (
     Console,
     ConsoleOptions,
-    ConsoleRenderable,
     RenderResult,
 )
 from rich.padding import Padding
@@ -24,25 +23,205 @@ from pyhcl2.rich_utils import (
 )
 from pyhcl2.values import String, Value
 
+# Segments are immutable tuples, so the fixed punctuation of the renderers
+# is built once and shared by every node.
+_LBRACKET = Segment("[")
+_RBRACKET = Segment("]")
+_LBRACE = Segment("{")
+_RBRACE = Segment("}")
+_LPAREN = Segment("(")
+_RPAREN = Segment(")")
+_COMMA = Segment(", ")
+_ASSIGN = Segment(" = ")
+_ELLIPSIS = Segment("...")
+_DOT = Segment(".")
+_SPACE = Segment(" ")
+_NEWLINE = Segment("\n")
+_COLON = Segment(" : ")
+_QUESTION = Segment(" ? ")
+_ARROW = Segment(" => ")
+_BLOCK_OPEN = Segment(" {")
+_ATTR_SPLAT = Segment(".*")
+_INDEX_SPLAT = Segment("[*]")
+_KW_FOR = Segment("for ", style=STYLE_KEYWORDS)
+_KW_IN = Segment(" in ", style=STYLE_KEYWORDS)
+_KW_IF = Segment(" if ", style=STYLE_KEYWORDS)
+_UNARY_SEGMENTS = {op: Segment(op) for op in ("-", "!")}
+_BINARY_SEGMENTS = {
+    op: Segment(op)
+    for op in ("==", "!=", "<", ">", "<=", ">=", "-", "*", "/", "%", "&&", "||", "+")
+}
+
+
+_T = t.TypeVar("_T")
+
+
+class _NodeCache:
+    """Base providing the one slot in which a node keeps its cached values.
+
+    Nodes have no instance `__dict__`, so computed values live in a dict
+    that is only allocated once something is cached. The slot is not a
+    dataclass field, so it is left out of equality, repr and pickling.
+    """
+
+    __slots__ = ("_cache",)
+
+    _cache: dict[str, object]
+
+    # Frozen slotted dataclasses get field-only pickling from dataclasses,
+    # but the mutable nodes of optimized builds would otherwise pickle the
+    # cache, including a hash that is only valid under this process's seed.
+    def __getstate__(self) -> list[object]:
+        return [getattr(self, f.name) for f in dataclasses.fields(self)]  # type: ignore[arg-type]
+
+    def __setstate__(self, state: list[object]) -> None:
+        for f, value in zip(dataclasses.fields(self), state, strict=True):  # type: ignore[arg-type]
+            object.__setattr__(self, f.name, value)
+
+
+def _node_cache(node: _NodeCache) -> dict[str, object]:
+    try:
+        return node._cache
+    except AttributeError:
+        cache: dict[str, object] = {}
+        # Bypasses the frozen __setattr__ of debug builds
+        object.__setattr__(node, "_cache", cache)
+        return cache
+
+
+class _cached_property(t.Generic[_T]):  # noqa: N801
+    """`functools.cached_property` for slotted nodes, backed by `_NodeCache`."""
+
+    def __init__(self, func: t.Callable[[t.Any], _T]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    @t.overload
+    def __get__(self, instance: None, owner: type | None = None) -> t.Self: ...
+
+    @t.overload
+    def __get__(self, instance: _NodeCache, owner: type | None = None) -> _T: ...
+
+    def __get__(
+        self, instance: _NodeCache | None, owner: type | None = None
+    ) -> t.Self | _T:
+        if instance is None:
+            return self
+        cache = _node_cache(instance)
+        try:
+            return t.cast(_T, cache[self.name])
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
+
+
+_N = t.TypeVar("_N")
+
+
+def _cached_hash(
+    field_hash: t.Callable[[_NodeCache], int],
+) -> t.Callable[[_NodeCache], int]:
+    """Wraps a generated dataclass hash so each node hashes its subtree once."""
+
+    def cached_hash(self: _NodeCache) -> int:
+        cache = _node_cache(self)
+        try:
+            return t.cast(int, cache["_hash"])
+        except KeyError:
+            value = cache["_hash"] = field_hash(self)
+            return value
 
-@dataclass(frozen=True, eq=True, kw_only=True)
-class Node(ConsoleRenderable):
-    """Base class for HCL2 AST nodes."""
+    return cached_hash
+
+
+@t.overload
+def node_dataclass(cls: type[_N], /) -> type[_N]: ...
+
+
+@t.overload
+def node_dataclass(*, kw_only: bool = False) -> t.Callable[[type[_N]], type[_N]]: ...
+
+
+@t.dataclass_transform(frozen_default=True, eq_default=True)
+def node_dataclass(
+    cls: type[_N] | None = None, /, *, kw_only: bool = False
+) -> type[_N] | t.Callable[[type[_N]], type[_N]]:
+    """Dataclass decorator for AST nodes.
+
+    Nodes are treated as immutable everywhere, but immutability is only
+    enforced in debug runs. Under `python -O` the nodes skip the frozen
+    __setattr__ path, which makes building them during parsing cheaper. The
+    hash is generated explicitly, so nodes used as object keys hash the same
+    either way.
+    """
+
+    def wrap(cls: type[_N]) -> type[_N]:
+        node_cls = dataclass(
+            frozen=__debug__, eq=True, unsafe_hash=True, kw_only=kw_only, slots=True
+        )(cls)
+        node_cls.__hash__ = _cached_hash(node_cls.__hash__)  # type: ignore[method-assign,assignment]
+        return node_cls
+
+    return wrap if cls is None else wrap(cls)
+
+
+@node_dataclass(kw_only=True)
+class Node(_NodeCache):
+    """Base class for HCL2 AST nodes.
+
+    Every class in the hierarchy is slotted, so nodes carry no `__dict__`.
+    Nodes render through `__rich_console__` without inheriting rich's
+    ConsoleRenderable protocol, whose unslotted class would add one.
+    """
 
     span: SourceSpan = field(default=SourceSpan(-1, -1), compare=False, hash=False)
 
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        raise NotImplementedError()
+
     def rich_highlights(self) -> Iterable[Span]:
         return []
 
 
+class CachedHighlights(_NodeCache):
+    """Mixin caching the highlight spans of a composite node.
+
+    Nodes are immutable, so the spans are computed once by
+    `_compute_highlights` and replayed on every later call.
+    """
+
+    __slots__ = ()
+
+    @_cached_property
+    def _highlights(self) -> tuple[Span, ...]:
+        return tuple(self._compute_highlights())
+
+    def _compute_highlights(self) -> Iterable[Span]:
+        raise NotImplementedError()
+
+    def rich_highlights(self) -> Iterable[Span]:
+        return iter(self._highlights)
+
+
 class Expression(Node):
     """Base class for nodes that represent expressions in HCL2."""
 
+    __slots__ = ()
+
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class Literal(Expression):
     value: Value
 
+    def spanned_value(self) -> Value:
+        """The literal value, falling back to the span of this node."""
+        if self.value.span is None:
+            return self.value.with_span(self.span)
+        return self.value
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
@@ -52,58 +231,109 @@ class Literal(Expression):
         return self.value.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
-class ArrayExpression(Expression):
+@node_dataclass
+class ArrayExpression(CachedHighlights, Expression):
     values: list[Expression]
 
+    @_cached_property
+    def literal_values(self) -> tuple[Value, ...] | None:
+        """The evaluated values of this array if all of its items are literals."""
+        literals = [value for value in self.values if type(value) is Literal]
+        if len(literals) != len(self.values):
+            return None
+        return tuple(literal.spanned_value() for literal in literals)
+
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("[")
-        for i, value in enumerate(self.values):
-            yield value
-            if i < len(self.values) - 1:
-                yield Segment(", ")
-        yield Segment("]")
-
-    def rich_highlights(self) -> Iterable[Span]:
+        yield _LBRACKET
+        values = self.values
+        if values:
+            yield values[0]
+            for value in islice(values, 1, None):
+                yield _COMMA
+                yield value
+        yield _RBRACKET
+
+    def _compute_highlights(self) -> Iterable[Span]:
         for value in self.values:
             yield from value.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
-class ObjectExpression(Expression):
-    fields: dict[Expression, Expression]
+@node_dataclass
+class ObjectExpression(CachedHighlights, Expression):
+    fields: list[tuple[Expression, Expression]]
+
+    @_cached_property
+    def literal_fields(self) -> dict[String, Value] | None:
+        """The evaluated fields of this object if all keys and values are literals."""
+        result: dict[String, Value] = {}
+        for key, (_, value) in zip(self.static_keys, self.fields, strict=True):
+            if key is None or type(value) is not Literal:
+                return None
+            result[key] = value.spanned_value()
+        return result
+
+    @_cached_property
+    def static_keys(self) -> tuple[String | None, ...]:
+        """The resolved key of each field, or None where the key is computed."""
+        keys: list[String | None] = []
+        for key, _ in self.fields:
+            match key:
+                case Identifier(name):
+                    keys.append(String.intern(name))
+                case Literal(String() as string):
+                    keys.append(string)
+                case _:
+                    keys.append(None)
+        return tuple(keys)
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("{")
-        for i, (key, value) in enumerate(self.fields.items()):
-            if isinstance(key, Identifier):
-                yield Segment(key.name, style=STYLE_PROPERTY_NAME)
+        yield _LBRACE
+        separator = None
+        for key, value in self.fields:
+            # Only the first field is rendered without a leading separator
+            if separator is not None:
+                yield separator
+            separator = _COMMA
+            if type(key) is Identifier:
+                yield t.cast(Identifier, key)._property_segment
             else:
                 yield key
-            yield Segment(" = ")
+            yield _ASSIGN
             yield value
-            if i < len(self.fields) - 1:
-                yield Segment(", ")
-        yield Segment("}")
+        yield _RBRACE
 
-    def rich_highlights(self) -> Iterable[Span]:
-        for key, value in self.fields.items():
-            if isinstance(key, Identifier):
+    def _compute_highlights(self) -> Iterable[Span]:
+        for key, value in self.fields:
+            if type(key) is Identifier:
                 yield key.span.styled(STYLE_PROPERTY_NAME)
             else:
                 yield from key.rich_highlights()
             yield from value.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class Identifier(Expression):
     name: str
 
     def as_string(self) -> String:
+        return self._string
+
+    # Rendered segments depend only on the name, so they are built once
+    @_cached_property
+    def _segment(self) -> Segment:
+        return Segment(self.name)
+
+    @_cached_property
+    def _property_segment(self) -> Segment:
+        return Segment(self.name, style=STYLE_PROPERTY_NAME)
+
+    @_cached_property
+    def _string(self) -> String:
+        # Strings are immutable, so every caller can share one instance
         return String(
             self.name,
             span=self.span,
@@ -112,71 +342,74 @@ class Identifier(Expression):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(self.name)
+        yield self._segment
 
     def rich_highlights(self) -> Iterable[Span]:
         return []
 
 
-@dataclass(frozen=True, eq=True)
-class FunctionCall(Expression):
+@node_dataclass
+class FunctionCall(CachedHighlights, Expression):
     ident: Identifier
     args: list[Expression]
     var_args: bool = False
 
-    @property
+    @_cached_property
+    def _name_segment(self) -> Segment:
+        return Segment(self.ident.name, style=STYLE_FUNCTION)
+
+    @_cached_property
     def args_span(self) -> SourceSpan:
         return SourceSpan(self.ident.span.end, self.span.end)
 
-    def __post_init__(self) -> None:
-        assert all(isinstance(arg, Expression) for arg in self.args), self.args
-
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(self.ident.name, style=STYLE_FUNCTION)
-        yield Segment("(")
-        for i, arg in enumerate(self.args):
-            yield arg
-            if i < len(self.args) - 1:
-                yield Segment(", ")
+        yield self._name_segment
+        yield _LPAREN
+        args = self.args
+        if args:
+            yield args[0]
+            for arg in islice(args, 1, None):
+                yield _COMMA
+                yield arg
         if self.var_args:
-            yield Segment("...")
-        yield Segment(")")
+            yield _ELLIPSIS
+        yield _RPAREN
 
-    def rich_highlights(self) -> Iterable[Span]:
+    def _compute_highlights(self) -> Iterable[Span]:
         yield self.ident.span.styled(STYLE_FUNCTION)
         for arg in self.args:
             yield from arg.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class GetAttrKey(Node):
     ident: Identifier
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(".")
+        yield _DOT
         yield self.ident
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class GetIndexKey(Node):
     expr: Expression
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("[")
+        yield _LBRACKET
         yield self.expr
-        yield Segment("]")
+        yield _RBRACKET
 
     def rich_highlights(self) -> Iterable[Span]:
         yield from self.expr.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class GetAttr(Expression):
     on: Expression
     key: GetAttrKey
@@ -192,7 +425,7 @@ class GetAttr(Expression):
         yield from self.key.ident.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class GetIndex(Expression):
     on: Expression
     key: GetIndexKey
@@ -208,16 +441,16 @@ class GetIndex(Expression):
         yield from self.key.expr.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class AttrSplat(Expression):
     on: Expression
-    keys: list[GetAttrKey] = dataclasses.field(default_factory=list)
+    keys: tuple[GetAttrKey, ...] = ()
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         yield self.on
-        yield Segment(".*")
+        yield _ATTR_SPLAT
         yield from self.keys
 
     def rich_highlights(self) -> Iterable[Span]:
@@ -226,16 +459,16 @@ class AttrSplat(Expression):
             yield from key.ident.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class IndexSplat(Expression):
     on: Expression
-    keys: list[GetAttrKey | GetIndexKey] = dataclasses.field(default_factory=list)
+    keys: tuple[GetAttrKey | GetIndexKey, ...] = ()
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         yield self.on
-        yield Segment("[*]")
+        yield _INDEX_SPLAT
         yield from self.keys
 
     def rich_highlights(self) -> Iterable[Span]:
@@ -244,20 +477,20 @@ class IndexSplat(Expression):
             yield from key.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class UnaryOperator(Node):
     type: t.Literal["-", "!"]
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(self.type)
+        yield _UNARY_SEGMENTS[self.type]
 
     def rich_highlights(self) -> Iterable[Span]:
         return []
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class UnaryExpression(Expression):
     op: UnaryOperator
     expr: Expression
@@ -273,7 +506,7 @@ class UnaryExpression(Expression):
         yield from self.expr.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class BinaryOperator(Node):
     type: t.Literal[
         "==", "!=", "<", ">", "<=", ">=", "-", "*", "/", "%", "&&", "||", "+"
@@ -282,14 +515,14 @@ class BinaryOperator(Node):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(self.type)
+        yield _BINARY_SEGMENTS[self.type]
 
     def rich_highlights(self) -> Iterable[Span]:
         return []
 
 
-@dataclass(frozen=True, eq=True)
-class BinaryExpression(Expression):
+@node_dataclass
+class BinaryExpression(CachedHighlights, Expression):
     op: BinaryOperator
     left: Expression
     right: Expression
@@ -298,18 +531,18 @@ class BinaryExpression(Expression):
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         yield self.left
-        yield Segment(" ")
+        yield _SPACE
         yield self.op
-        yield Segment(" ")
+        yield _SPACE
         yield self.right
 
-    def rich_highlights(self) -> Iterable[Span]:
+    def _compute_highlights(self) -> Iterable[Span]:
         yield from self.left.rich_highlights()
         yield from self.op.rich_highlights()
         yield from self.right.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class Conditional(Expression):
     cond: Expression
     then_expr: Expression
@@ -319,9 +552,9 @@ class Conditional(Expression):
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
         yield self.cond
-        yield Segment(" ? ")
+        yield _QUESTION
         yield self.then_expr
-        yield Segment(" : ")
+        yield _COLON
         yield self.else_expr
 
     def rich_highlights(self) -> Iterable[Span]:
@@ -330,23 +563,23 @@ class Conditional(Expression):
         yield from self.else_expr.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class Parenthesis(Expression):
     expr: Expression
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("(")
+        yield _LPAREN
         yield self.expr
-        yield Segment(")")
+        yield _RPAREN
 
     def rich_highlights(self) -> Iterable[Span]:
         yield from self.expr.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
-class ForTupleExpression(Expression):
+@node_dataclass
+class ForTupleExpression(CachedHighlights, Expression):
     key_ident: Identifier | None
     value_ident: Identifier
     collection: Expression
@@ -356,48 +589,48 @@ class ForTupleExpression(Expression):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("[")
-        yield Segment("for ", style=STYLE_KEYWORDS)
+        yield _LBRACKET
+        yield _KW_FOR
         if self.key_ident is not None:
             yield self.key_ident
-            yield Segment(", ")
+            yield _COMMA
         yield self.value_ident
-        yield Segment(" in ", style=STYLE_KEYWORDS)
+        yield _KW_IN
         yield self.collection
-        yield Segment(" : ")
+        yield _COLON
         yield self.value
         if self.condition is not None:
-            yield Segment(" if ", style=STYLE_KEYWORDS)
+            yield _KW_IF
             yield self.condition
-        yield Segment("]")
+        yield _RBRACKET
 
-    def rich_highlights(self) -> Iterable[Span]:
-        yield SourceSpan(
-            self.span.start + 1,
-            self.key_ident.span.start - 1
-            if self.key_ident is not None
-            else self.value_ident.span.start - 1,
-        ).styled(STYLE_KEYWORDS)
+    def _compute_highlights(self) -> Iterable[Span]:
+        first_ident = self.key_ident if self.key_ident is not None else self.value_ident
+        yield Span(self.span.start + 1, first_ident.span.start - 1, STYLE_KEYWORDS)
 
         if self.key_ident is not None:
             yield from self.key_ident.rich_highlights()
         yield from self.value_ident.rich_highlights()
 
-        yield SourceSpan(
-            self.value_ident.span.end + 1, self.collection.span.start - 1
-        ).styled(STYLE_KEYWORDS)
+        yield Span(
+            self.value_ident.span.end + 1,
+            self.collection.span.start - 1,
+            STYLE_KEYWORDS,
+        )
 
         yield from self.collection.rich_highlights()
         yield from self.value.rich_highlights()
         if self.condition is not None:
-            yield SourceSpan(
-                self.value.span.end + 1, self.condition.span.start - 1
-            ).styled(STYLE_KEYWORDS)
+            yield Span(
+                self.value.span.end + 1,
+                self.condition.span.start - 1,
+                STYLE_KEYWORDS,
+            )
             yield from self.condition.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
-class ForObjectExpression(Expression):
+@node_dataclass
+class ForObjectExpression(CachedHighlights, Expression):
     key_ident: Identifier | None
     value_ident: Identifier
     collection: Expression
@@ -409,70 +642,81 @@ class ForObjectExpression(Expression):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("{")
-        yield Segment("for ", style=STYLE_KEYWORDS)
+        yield _LBRACE
+        yield _KW_FOR
         if self.key_ident is not None:
             yield self.key_ident
-            yield Segment(", ")
+            yield _COMMA
         yield self.value_ident
-        yield Segment(" in ", style=STYLE_KEYWORDS)
+        yield _KW_IN
         yield self.collection
-        yield Segment(" : ")
+        yield _COLON
         yield self.key
-        yield Segment(" => ")
+        yield _ARROW
         yield self.value
         if self.condition is not None:
-            yield Segment(" if ", style=STYLE_KEYWORDS)
+            yield _KW_IF
             yield self.condition
         if self.grouping_mode:
-            yield Segment("...")
-        yield Segment("}")
+            yield _ELLIPSIS
+        yield _RBRACE
 
-    def rich_highlights(self) -> Iterable[Span]:
-        yield SourceSpan(
-            self.span.start + 1,
-            self.key_ident.span.start - 1
-            if self.key_ident is not None
-            else self.value_ident.span.start - 1,
-        ).styled(STYLE_KEYWORDS)
+    def _compute_highlights(self) -> Iterable[Span]:
+        first_ident = self.key_ident if self.key_ident is not None else self.value_ident
+        yield Span(self.span.start + 1, first_ident.span.start - 1, STYLE_KEYWORDS)
         yield from (
             self.key_ident.rich_highlights() if self.key_ident is not None else []
         )
         yield from self.value_ident.rich_highlights()
-        yield SourceSpan(
-            self.value_ident.span.end + 1, self.collection.span.start - 1
-        ).styled(STYLE_KEYWORDS)
+        yield Span(
+            self.value_ident.span.end + 1,
+            self.collection.span.start - 1,
+            STYLE_KEYWORDS,
+        )
         yield from self.collection.rich_highlights()
         yield from self.key.rich_highlights()
         if self.condition is not None:
-            yield SourceSpan(
-                self.value.span.end + 1, self.condition.span.start - 1
-            ).styled(STYLE_KEYWORDS)
+            yield Span(
+                self.value.span.end + 1,
+                self.condition.span.start - 1,
+                STYLE_KEYWORDS,
+            )
             yield from self.condition.rich_highlights()
 
 
+NODE_KIND_ATTRIBUTE = 1
+NODE_KIND_BLOCK = 2
+
+
 class Stmt(Node):
     """Base class for nodes that represent statements in HCL2."""
 
+    __slots__ = ()
+
+    # Integer tag used to partition statement lists without isinstance checks
+    NODE_KIND: t.ClassVar[int] = 0
+
     @property
     def key_path(self) -> tuple[str, ...]:
         raise NotImplementedError()
 
 
-@dataclass(frozen=True, eq=True)
+@node_dataclass
 class Attribute(Stmt):
+    NODE_KIND: t.ClassVar[int] = NODE_KIND_ATTRIBUTE
+
     key: Identifier
     value: Expression
 
-    @property
+    @_cached_property
     def key_path(self) -> tuple[str, ...]:
         return (self.key.name,)
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(self.key.name, style=STYLE_PROPERTY_NAME)
-        yield Segment(" = ")
+        yield self.key._property_segment
+        yield _ASSIGN
         yield self.value
 
     def rich_highlights(self) -> Iterable[Span]:
@@ -480,41 +724,42 @@ class Attribute(Stmt):
         yield from self.value.rich_highlights()
 
 
-@dataclass(frozen=True, eq=True)
-class Block(Stmt):
+@node_dataclass
+class Block(CachedHighlights, Stmt):
+    NODE_KIND: t.ClassVar[int] = NODE_KIND_BLOCK
+
     type: Identifier
     labels: list[Literal | Identifier]
     body: list[Stmt]
 
-    @property
+    @_cached_property
     def key_span(self) -> SourceSpan:
         return SourceSpan(
             self.type.span.start,
             self.labels[-1].span.end if self.labels else self.type.span.end,
         )
 
-    @property
+    @_cached_property
+    def _type_segment(self) -> Segment:
+        return Segment(self.type.name, style=STYLE_KEYWORDS)
+
+    @_cached_property
     def keys(self) -> tuple[String, ...]:
         key_parts: list[String] = [self.type.as_string()]
+        # Labels are only ever Identifier or Literal nodes, so an exact type
+        # check replaces the class pattern match
         for label in self.labels:
-            match label:
-                case Identifier() as label:
-                    key_parts.append(label.as_string())
-                case Literal(value=String() as string):
-                    key_parts.append(string)
-                case _:
-                    pass
+            if type(label) is Identifier:
+                key_parts.append(label.as_string())
+            else:
+                value = t.cast(Literal, label).value
+                if type(value) is String:
+                    key_parts.append(value)
         return tuple(key_parts)
 
-    @property
+    @_cached_property
     def key_path(self) -> tuple[str, ...]:
-        key_parts: list[str] = [self.type.name]
-        for label in self.labels:
-            if isinstance(label, Identifier):
-                key_parts.append(label.name)
-            elif isinstance(label, Literal) and isinstance(label.value, String):
-                key_parts.append(label.value.raw())
-        return tuple(key_parts)
+        return tuple([key.raw() for key in self.keys])
 
     def key(self) -> tuple[str, ...]:
         return self.key_path
@@ -522,57 +767,81 @@ class Block(Stmt):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment(self.type.name, style=STYLE_KEYWORDS)
+        yield self._type_segment
         for label in self.labels:
-            yield Segment(" ")
+            yield _SPACE
             yield label
-        yield Segment(" {")
-        yield Segment("\n")
+        yield _BLOCK_OPEN
+        yield _NEWLINE
         for stmt in self.body:
             yield Padding(stmt, (0, 2))
-        yield Segment("}")
+        yield _RBRACE
 
-    def rich_highlights(self) -> Iterable[Span]:
+    def _compute_highlights(self) -> Iterable[Span]:
         yield self.type.span.styled(STYLE_KEYWORDS)
         for label in self.labels:
             yield from label.rich_highlights()
         for stmt in self.body:
             yield from stmt.rich_highlights()
 
-    @cached_property
+    @_cached_property
+    def _partitioned_body(self) -> tuple[dict[str, Expression], list[Block]]:
+        # A single pass over the body fills both statement views
+        attributes: dict[str, Expression] = {}
+        blocks: list[Block] = []
+        for stmt in self.body:
+            kind = stmt.NODE_KIND
+            if kind == NODE_KIND_ATTRIBUTE:
+                attr = t.cast(Attribute, stmt)
+                attributes[attr.key.name] = attr.value
+            elif kind == NODE_KIND_BLOCK:
+                blocks.append(t.cast(Block, stmt))
+        return attributes, blocks
+
+    @_cached_property
     def attributes(self) -> dict[str, Expression]:
-        return {
-            stmt.key.name: stmt.value
-            for stmt in self.body
-            if isinstance(stmt, Attribute)
-        }
+        return self._partitioned_body[0]
 
-    @cached_property
+    @_cached_property
     def blocks(self) -> list[Block]:
-        return [stmt for stmt in self.body if isinstance(stmt, Block)]
+        return self._partitioned_body[1]
 
 
-@dataclass(frozen=True, eq=True)
-class Module(Node):
+@node_dataclass
+class Module(CachedHighlights, Node):
     body: list[Stmt]
 
+    @_cached_property
+    def _blocks(self) -> list[Block]:
+        return t.cast(
+            list[Block],
+            [stmt for stmt in self.body if stmt.NODE_KIND == NODE_KIND_BLOCK],
+        )
+
+    @_cached_property
+    def _blocks_by_type(self) -> dict[str, list[Block]]:
+        index: dict[str, list[Block]] = {}
+        for block in self._blocks:
+            index.setdefault(block.type.name, []).append(block)
+        return index
+
+    @_cached_property
+    def _blocks_by_key_path(self) -> dict[tuple[str, ...], list[Block]]:
+        index: dict[tuple[str, ...], list[Block]] = {}
+        for block in self._blocks:
+            index.setdefault(block.key_path, []).append(block)
+        return index
+
     def get_blocks(self, block_type: str | None) -> list[Block]:
-        return [
-            stmt
-            for stmt in self.body
-            if isinstance(stmt, Block)
-            and (block_type is None or stmt.type.name == block_type)
-        ]
+        if block_type is None:
+            return list(self._blocks)
+        return list(self._blocks_by_type.get(block_type, ()))
 
     def get_block(self, block_type: str, *labels: str) -> Block | None:
-        blocks = self.get_blocks(block_type)
-
         if len(labels) > 0:
-            blocks = [
-                block
-                for block in blocks
-                if block.labels == [Literal(String(label)) for label in labels]
-            ]
+            blocks = self._blocks_by_key_path.get((block_type, *labels), [])
+        else:
+            blocks = self._blocks_by_type.get(block_type, [])
 
         if len(blocks) > 1:
             raise ValueError(f"Multiple {block_type} blocks found")
@@ -585,15 +854,16 @@ class Module(Node):
     ) -> RenderResult:
         for stmt in self.body:
             yield stmt
-            yield Segment("\n")
+            yield _NEWLINE
 
-    def rich_highlights(self) -> Iterable[Span]:
+    def _compute_highlights(self) -> Iterable[Span]:
         for stmt in self.body:
             yield from stmt.rich_highlights()
 
 
+@node_dataclass
 class VarArgsMarker(Node):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("...")
+        yield _ELLIPSIS
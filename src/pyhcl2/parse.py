@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing as t
+from functools import cache
 
 from lark import Lark, Token, UnexpectedCharacters, UnexpectedToken
 from pyagnostics.exceptions import DiagnosticError
@@ -9,6 +10,63 @@ from pyagnostics.spans import LabeledSpan, SourceSpan
 from pyhcl2.nodes import Expression, Module, Node, Stmt
 from pyhcl2.transformer import ToAstTransformer
 
+# The transformer holds no per-parse state, so one instance serves all calls
+_TRANSFORMER = ToAstTransformer()
+
+
+@cache
+def _lark(start: str) -> Lark:
+    """The parser for a start symbol, loaded once per process."""
+    return Lark.open(
+        "hcl2.lark",
+        parser="lalr",
+        start=start,
+        cache=True,
+        rel_to=__file__,
+        propagate_positions=True,
+    )
+
+
+# Diagnostic code, message and label for each kind of unexpected token
+_UNEXPECTED_TOKEN_DIAGNOSTICS: dict[str, tuple[str, str, str]] = {
+    "eof": (
+        "pyhcl2::parser::unexpected_eof",
+        "The parser expected a token, but the input ended",
+        "Unexpected EOF",
+    ),
+    "newline": (
+        "pyhcl2::parser::unexpected_newline",
+        "The parser encountered an unexpected newline",
+        "Unexpected newline",
+    ),
+    "token": (
+        "pyhcl2::parser::unexpected_token",
+        "The parser encountered an unexpected token",
+        "Unexpected token",
+    ),
+}
+
+
+def _unexpected_token_error(token: Token) -> DiagnosticError:
+    if token.type == "$END":
+        kind = "eof"
+        # Lark leaves end_pos unset when the input is empty, the span is
+        # passed through as is
+        span = SourceSpan(t.cast(int, token.start_pos), t.cast(int, token.end_pos))
+    else:
+        kind = "newline" if token.value == "\n" else "token"
+        assert token.start_pos is not None
+        assert token.end_pos is not None
+        span = SourceSpan(token.start_pos, token.end_pos)
+    code, message, label = _UNEXPECTED_TOKEN_DIAGNOSTICS[kind]
+
+    return DiagnosticError(
+        code=code,
+        message=message,
+        labels=[LabeledSpan(span, label)],
+        notes=[f"Got {token.value!r} instead"] if kind == "token" else [],
+    )
+
 
 def parse_file(file: t.TextIO) -> Module:
     return parse_module(file.read())
@@ -16,16 +74,8 @@ def parse_file(file: t.TextIO) -> Module:
 
 def parse_string(text: str, start: str) -> Node:
     try:
-        lark = Lark.open(
-            "hcl2.lark",
-            parser="lalr",
-            start=start,
-            cache=True,
-            rel_to=__file__,
-            propagate_positions=True,
-        )
-        parse_tree = lark.parse(text)
-        ast = ToAstTransformer().transform(parse_tree)
+        parse_tree = _lark(start).parse(text)
+        ast = _TRANSFORMER.transform(parse_tree)
 
     except UnexpectedCharacters as e:
         assert e.pos_in_stream is not None
@@ -40,45 +90,11 @@ def parse_string(text: str, start: str) -> Node:
             ],
         ) from None
     except UnexpectedToken as e:
+        error = _unexpected_token_error(e.token)
+        # Running out of input keeps lark's exception as the cause
         if e.token.type == "$END":
-            raise DiagnosticError(
-                code="pyhcl2::parser::unexpected_eof",
-                message="The parser expected a token, but the input ended",
-                labels=[
-                    LabeledSpan(
-                        SourceSpan(e.token.start_pos, e.token.end_pos), "Unexpected EOF"
-                    )
-                ],
-            ) from e
-        else:
-            assert isinstance(e.token, Token)
-            assert e.token.start_pos is not None
-            assert e.token.end_pos is not None
-            if e.token.value == "\n":
-                raise DiagnosticError(
-                    code="pyhcl2::parser::unexpected_newline",
-                    message="The parser encountered an unexpected newline",
-                    labels=[
-                        LabeledSpan(
-                            SourceSpan(e.token.start_pos, e.token.end_pos),
-                            "Unexpected newline",
-                        )
-                    ],
-                ) from None
-            else:
-                raise DiagnosticError(
-                    code="pyhcl2::parser::unexpected_token",
-                    message="The parser encountered an unexpected token",
-                    labels=[
-                        LabeledSpan(
-                            SourceSpan(e.token.start_pos, e.token.end_pos),
-                            "Unexpected token",
-                        )
-                    ],
-                    notes=[
-                        f"Got {e.token.value!r} instead",
-                    ],
-                ) from None
+            raise error from e
+        raise error from None
 
     return t.cast(Node, ast)
 
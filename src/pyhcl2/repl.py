@@ -9,12 +9,15 @@ from pyhcl2.eval import EvaluationScope, Evaluator
 from pyhcl2.parse import parse_expr_or_stmt
 from pyhcl2.rich_utils import HclHighlighter, Inline
 
+EXIT_COMMANDS = frozenset({"exit", "quit"})
+
 
 def main() -> None:
     from prompt_toolkit import PromptSession  # type: ignore
     from prompt_toolkit.auto_suggest import AutoSuggestFromHistory  # type: ignore
     from prompt_toolkit.history import FileHistory  # type: ignore
 
+    console = rich.get_console()
     scope = EvaluationScope()
     evaluator = Evaluator(intrinsic_functions={"identity": lambda x: x})
     session: PromptSession = PromptSession(
@@ -24,10 +27,10 @@ def main() -> None:
         while True:
             text = session.prompt("> ", auto_suggest=AutoSuggestFromHistory())
 
-            if text == "":
+            command = text.strip()
+            if not command:
                 continue
-
-            if text == "exit":
+            if command in EXIT_COMMANDS:
                 break
 
             src = InMemorySource(text)
@@ -37,11 +40,11 @@ def main() -> None:
                     src, highlighter=HclHighlighter(ast)
                 ):
                     result = evaluator.eval(ast, scope)
-                    rich.print(Inline(result.resolve().raise_on_unknown(), NewLine()))
+                    console.print(
+                        Inline(result.resolve().raise_on_unknown(), NewLine())
+                    )
             except DiagnosticError as diagnostic:
-                rich.get_console().print(
-                    diagnostic.with_source_code(src), highlight=False
-                )
+                console.print(diagnostic.with_source_code(src), highlight=False)
 
     except KeyboardInterrupt:
         pass
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate
+from operator import attrgetter
 
 from pyagnostics.protocols import SourceCodeHighlighter, SpanContents
 from rich.color import Color
@@ -21,34 +25,53 @@ STYLE_FUNCTION = Style(color=Color.from_rgb(136, 136, 198))
 class HclHighlighter(SourceCodeHighlighter):
     ast: nodes.Node
 
+    @cached_property
+    def _index(self) -> tuple[list[Span], list[int], list[int]]:
+        """Highlights sorted by start, with the running maximum of their ends.
+
+        The running maximum is non-decreasing, so both bounds of the spans
+        overlapping a window can be found by bisection.
+        """
+        highlights = sorted(self.ast.rich_highlights(), key=attrgetter("start"))
+        starts = [span.start for span in highlights]
+        max_ends = list(accumulate((span.end for span in highlights), max))
+        return highlights, starts, max_ends
+
     def highlight(self, span_contents: SpanContents) -> SpanContents:
+        highlights, starts, max_ends = self._index
+        window_start = span_contents.span.start
+        window_end = span_contents.span.end
+
+        # Everything before `lower` ends at or before the window start, and
+        # everything from `upper` on starts at or after the window end.
+        lower = bisect_right(max_ends, window_start)
+        upper = bisect_left(starts, window_end)
+
         spans: list[Span] = [
-            Span(
-                span.start - span_contents.span.start,
-                span.end - span_contents.span.start,
-                span.style,
-            )
-            for span in self.ast.rich_highlights()
-            if span.start < span_contents.span.end
-            and span.end > span_contents.span.start
+            Span(span.start - window_start, span.end - window_start, span.style)
+            for span in highlights[lower:upper]
+            if span.end > window_start
         ]
         span_contents.text.spans.extend(spans)
         return span_contents
 
 
+def _inline_renderable(renderable: RenderableType) -> RenderableType:
+    """Strips the trailing newline from text so it renders inline."""
+    if isinstance(renderable, str):
+        return Text(renderable, end="")
+    if isinstance(renderable, Text) and renderable.end != "":
+        text = renderable.copy()
+        text.end = ""
+        return text
+    return renderable
+
+
 class Inline:
     def __init__(self, *renderables: RenderableType) -> None:
-        self.renderables: list[RenderableType] = []
-        for renderable in renderables:
-            match renderable:
-                case str() as text:
-                    self.renderables.append(Text(text, end=""))
-                case Text() as text:
-                    text = text.copy()
-                    text.end = ""
-                    self.renderables.append(text)
-                case _:
-                    self.renderables.append(renderable)
+        self.renderables: list[RenderableType] = [
+            _inline_renderable(renderable) for renderable in renderables
+        ]
 
     def __rich__(self) -> Group:
         return Group(*self.renderables)
@@ -9,7 +9,7 @@ from typing import (
 )
 
 import rich
-from rich.console import NewLine
+from rich.console import Group, NewLine
 
 from pyhcl2.eval import EvaluationScope, Evaluator
 from pyhcl2.nodes import Block, Node
@@ -19,11 +19,20 @@ from pyhcl2.values import Unknown, Value
 
 
 class IntrinsicFunctionTracker(Mapping):
+    __slots__ = ()
+
+    # Every intrinsic resolves to the same function, so hand out a single
+    # shared callable instead of building a new closure per lookup
     def __getattr__(self, item: str) -> Callable[..., Value]:
-        return lambda *args: Unknown.indirect(*args)
+        return Unknown.indirect
 
     def __getitem__(self, item: str) -> Callable[..., Value]:
-        return lambda *args: Unknown.indirect(*args)
+        return Unknown.indirect
+
+    # The evaluator looks intrinsics up with get(); answering directly skips
+    # the Mapping mixin's __getitem__/KeyError round trip
+    def get(self, key: str, default: object = None) -> Callable[..., Value]:
+        return Unknown.indirect
 
     def __contains__(self, item: object) -> bool:
         return True
@@ -35,20 +44,22 @@ class IntrinsicFunctionTracker(Mapping):
         return 0
 
 
+_INTRINSICS = IntrinsicFunctionTracker()
+_EVALUATOR = Evaluator(intrinsic_functions=_INTRINSICS)
+
+
 def resolve_variable_references(node: Node) -> set[tuple[str, ...]]:
     # noinspection PyTypeChecker
     scope = EvaluationScope()
-    result = Evaluator(intrinsic_functions=IntrinsicFunctionTracker()).eval(node, scope)
+    result = _EVALUATOR.eval(node, scope)
 
     match result.resolve():
         case Unknown() as unknown:
-            return set(
-                [
-                    cast(tuple[str, ...], ref.key)
-                    for ref in unknown.references
-                    if not any(part is None for part in ref.key)
-                ]
-            )
+            return {
+                cast(tuple[str, ...], ref.key)
+                for ref in unknown.references
+                if None not in ref.key
+            }
         case _:
             return set()
 
@@ -58,16 +69,19 @@ if __name__ == "__main__":
     rich.print(ast)
 
     blocks = [stmt for stmt in ast.body if isinstance(stmt, Block)]
+    console = rich.get_console()
 
     for block_under_test in blocks:
         variable_references = resolve_variable_references(block_under_test)
-
-        for dirty_child in variable_references:
-            rich.print(
-                Inline(
-                    ".".join(block_under_test.key()),
-                    " depends_on ",
-                    ".".join(dirty_child),
-                    NewLine(),
-                )
-            )
+        block_key = ".".join(block_under_test.key())
+
+        # Render every dependency of a block in one print call
+        console.print(
+            Group(
+                *[
+                    Inline(block_key, " depends_on ", ".".join(dirty_child), NewLine())
+                    for dirty_child in variable_references
+                ]
+            ),
+            end="",
+        )
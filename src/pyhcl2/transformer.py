@@ -4,9 +4,8 @@ import re
 import sys
 from typing import TypeVar, cast
 
-from lark import Discard, Token, Transformer, v_args
+from lark import Token, Transformer, v_args
 from lark.tree import Meta
-from lark.visitors import _DiscardType
 from pyagnostics.spans import SourceSpan
 
 from pyhcl2.nodes import (
@@ -38,11 +37,11 @@ from pyhcl2.nodes import (
 )
 from pyhcl2.values import Boolean, Float, Integer, Null, String
 
-HEREDOC_PATTERN = re.compile(r"<<([a-zA-Z][a-zA-Z0-9._-]+)\n((.|\n)*?)\n\s*\1", re.S)
-HEREDOC_TRIM_PATTERN = re.compile(
-    r"<<-([a-zA-Z][a-zA-Z0-9._-]+)\n((.|\n)*?)\n\s*\1", re.S
-)
+HEREDOC_PATTERN = re.compile(r"<<([a-zA-Z][a-zA-Z0-9._-]+)\n(.*?)\n\s*\1", re.S)
+HEREDOC_TRIM_PATTERN = re.compile(r"<<-([a-zA-Z][a-zA-Z0-9._-]+)\n(.*?)\n\s*\1", re.S)
+LEADING_SPACES_PATTERN = re.compile(r"^ *", re.MULTILINE)
 T = TypeVar("T")
+INTERN_STRING_MAX_LENGTH = 32
 
 
 # noinspection PyMethodMayBeStatic
@@ -117,8 +116,9 @@ class ToAstTransformer(Transformer):
 
     @v_args(meta=True)
     def float_lit(self, meta: Meta, args: list[Token]) -> Literal:
+        # Tokens are already strings, so they join without a str() per digit
         return Literal(
-            Float(float("".join([str(arg) for arg in args]))),
+            Float(float("".join(args))),
             span=SourceSpan(meta.start_pos, meta.end_pos),
         )
 
@@ -130,40 +130,38 @@ class ToAstTransformer(Transformer):
     @v_args(meta=True)
     def int_lit(self, meta: Meta, args: list[Token]) -> Literal:
         span = SourceSpan(meta.start_pos, meta.end_pos)
+        # DECIMAL matches one digit, so single-digit literals skip the join
         return Literal(
-            Integer(int("".join([str(arg) for arg in args])), span=span),
+            Integer(int(args[0] if len(args) == 1 else "".join(args)), span=span),
             span=span,
         )
 
-    @v_args(inline=True)
-    def expr_term(self, expr: Expression) -> Expression:
-        return expr
-
     @v_args(inline=True)
     def bool_lit(self, token: Token) -> Literal:
         assert token.start_pos is not None
         assert token.end_pos is not None
         span = SourceSpan(token.start_pos, token.end_pos)
-        match token.value.lower():
-            case "true":
-                return Literal(
-                    Boolean(True, span=span),
-                    span=span,
-                )
-            case "false":
-                return Literal(
-                    Boolean(False, span=span),
-                    span=span,
-                )
-        raise ValueError(f"Invalid boolean value: {token.value}")
+        # The keyword terminals are case-sensitive, so no lowercasing is needed
+        if token.value == "true":
+            value = True
+        elif token.value == "false":
+            value = False
+        else:
+            raise ValueError(f"Invalid boolean value: {token.value}")
+        return Literal(Boolean(value, span=span), span=span)
 
     @v_args(inline=True)
     def string_lit(self, token: Token) -> Literal:
         assert token.start_pos is not None
         assert token.end_pos is not None
         span = SourceSpan(token.start_pos, token.end_pos)
+        raw = token.value[1:-1]
+        # Short strings are typically keys, labels and enum-like values that
+        # repeat throughout a document, so they share one str instance.
+        if len(raw) <= INTERN_STRING_MAX_LENGTH:
+            raw = sys.intern(raw)
         return Literal(
-            String(token.value[1:-1], span=span),
+            String(raw, span=span),
             span=span,
         )
 
@@ -171,7 +169,11 @@ class ToAstTransformer(Transformer):
     def identifier(self, ident: Token) -> Expression:
         assert ident.start_pos is not None
         assert ident.end_pos is not None
-        return Identifier(ident.value, span=SourceSpan(ident.start_pos, ident.end_pos))
+        # Identifier names are used as variable and attribute keys during
+        # evaluation, interning them lets dict lookups compare by identity.
+        return Identifier(
+            sys.intern(ident.value), span=SourceSpan(ident.start_pos, ident.end_pos)
+        )
 
     @v_args(inline=True)
     def attribute(self, ident: Identifier, expr: Expression) -> Attribute:
@@ -196,9 +198,7 @@ class ToAstTransformer(Transformer):
     def object(
         self, meta: Meta, args: list[tuple[Expression, Expression]]
     ) -> ObjectExpression:
-        return ObjectExpression(
-            {kv[0]: kv[1] for kv in args}, span=SourceSpan(meta.start_pos, meta.end_pos)
-        )
+        return ObjectExpression(args, span=SourceSpan(meta.start_pos, meta.end_pos))
 
     @v_args(inline=True)
     def object_elem(
@@ -231,7 +231,7 @@ class ToAstTransformer(Transformer):
     def arguments(
         self, args: list[Expression]
     ) -> tuple[list[Expression], VarArgsMarker | None]:
-        if len(args) > 0 and isinstance(args[-1], VarArgsMarker):
+        if args and type(args[-1]) is VarArgsMarker:
             return args[:-1], cast(VarArgsMarker, args[-1])
         return args, None
 
@@ -249,35 +249,32 @@ class ToAstTransformer(Transformer):
     ) -> GetIndex:
         return GetIndex(on, index, span=SourceSpan(meta.start_pos, meta.end_pos))
 
-    def attr_splat(self, args: list[Node]) -> list[Node]:
-        return args
+    def attr_splat(self, args: list[Node]) -> tuple[Node, ...]:
+        return tuple(args)
 
     @v_args(meta=True, inline=True)
     def attr_splat_expr_term(
-        self, meta: Meta, on: Expression, keys: list[GetAttrKey]
+        self, meta: Meta, on: Expression, keys: tuple[GetAttrKey, ...]
     ) -> AttrSplat:
         return AttrSplat(on, keys, span=SourceSpan(meta.start_pos, meta.end_pos))
 
-    def full_splat(self, args: list[Node]) -> list[Node]:
-        return args
+    def full_splat(self, args: list[Node]) -> tuple[Node, ...]:
+        return tuple(args)
 
     @v_args(meta=True, inline=True)
     def full_splat_expr_term(
-        self, meta: Meta, on: Expression, keys: list[GetAttrKey | GetIndexKey]
+        self,
+        meta: Meta,
+        on: Expression,
+        keys: tuple[GetAttrKey | GetIndexKey, ...],
     ) -> IndexSplat:
         return IndexSplat(on, keys, span=SourceSpan(meta.start_pos, meta.end_pos))
 
-    def new_line_or_comment(self, _args: list[Node | Token]) -> _DiscardType:
-        return Discard
-
-    def new_line_and_or_comma(self, _args: list[Node | Token]) -> _DiscardType:
-        return Discard
-
-    def start(self, args: list[Node | Token]) -> Node | Token:
-        return args[0]
-
-    start_expr = start
-    start_expr_or_stmt = start
+    # A newline- or comment-only module has an empty body, which Lark cannot
+    # give a position to when inlined, so start stays a real rule
+    @v_args(inline=True)
+    def start(self, body: list[Stmt]) -> list[Stmt]:
+        return body
 
     def for_intro(
         self, args: list[Node | Token]
@@ -288,10 +285,6 @@ class ToAstTransformer(Transformer):
             cast(Expression, args[-1]),
         )
 
-    @v_args(inline=True)
-    def for_cond(self, condition: Expression) -> Expression:
-        return condition
-
     @v_args(meta=True, inline=True)
     def for_tuple_expr(
         self,
@@ -320,10 +313,15 @@ class ToAstTransformer(Transformer):
         *args: VarArgsMarker | Expression,
     ) -> ForObjectExpression:
         key_ident, value_ident, collection = for_intro
-        grouping_mode = any(isinstance(arg, VarArgsMarker) for arg in args)
-        condition: Expression | None = next(
-            (arg for arg in args if isinstance(arg, Expression)), None
-        )
+        # The trailing children are an optional ellipsis followed by an
+        # optional condition, so one pass sorts them out
+        grouping_mode = False
+        condition: Expression | None = None
+        for arg in args:
+            if type(arg) is VarArgsMarker:
+                grouping_mode = True
+            else:
+                condition = cast(Expression, arg)
 
         return ForObjectExpression(
             key_ident,
@@ -336,35 +334,33 @@ class ToAstTransformer(Transformer):
             span=SourceSpan(meta.start_pos, meta.end_pos),
         )
 
-    @v_args(meta=True)
-    def heredoc_template(self, meta: Meta, args: list[Node | Token]) -> Literal:
-        match = HEREDOC_PATTERN.match(str(args[0]))
+    @v_args(meta=True, inline=True)
+    def heredoc_template(self, meta: Meta, token: Token) -> Literal:
+        # Tokens are str subclasses, so they are matched without a str() copy
+        match = HEREDOC_PATTERN.match(token)
         if not match:
-            raise RuntimeError(f"Invalid Heredoc token: {args[0]}")
+            raise RuntimeError(f"Invalid Heredoc token: {token}")
         return Literal(
             String(f'"{match.group(2)}"'),
             span=SourceSpan(meta.start_pos, meta.end_pos),
         )
 
-    @v_args(meta=True)
-    def heredoc_template_trim(self, meta: Meta, args: list[Node | Token]) -> Literal:
-        match = HEREDOC_TRIM_PATTERN.match(str(args[0]))
+    @v_args(meta=True, inline=True)
+    def heredoc_template_trim(self, meta: Meta, token: Token) -> Literal:
+        match = HEREDOC_TRIM_PATTERN.match(token)
         if not match:
-            raise RuntimeError(f"Invalid Heredoc token: {args[0]}")
+            raise RuntimeError(f"Invalid Heredoc token: {token}")
 
         text = match.group(2)
-        lines = text.split("\n")
 
         # calculate the min number of leading spaces in each line
-        min_spaces = sys.maxsize
-        for line in lines:
-            leading_spaces = len(line) - len(line.lstrip(" "))
-            min_spaces = min(min_spaces, leading_spaces)
+        min_spaces = min(map(len, LEADING_SPACES_PATTERN.findall(text)))
 
         # trim off that number of leading spaces from each line
-        lines = [line[min_spaces:] for line in lines]
+        if min_spaces:
+            text = "\n".join([line[min_spaces:] for line in text.split("\n")])
 
         return Literal(
-            String(f'"{"\n".join(lines)}"'),
+            String(f'"{text}"'),
             span=SourceSpan(meta.start_pos, meta.end_pos),
         )
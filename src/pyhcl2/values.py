@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 from collections.abc import (
+    ItemsView,
     Iterable,
     Iterator,
     Mapping,
@@ -10,12 +11,14 @@ from collections.abc import (
     Sequence,
 )
 from dataclasses import dataclass, field
+from functools import cached_property
 from os import PathLike
 from typing import (
     Never,
     Self,
     overload,
 )
+from weakref import WeakValueDictionary
 
 from pyagnostics.exceptions import DiagnosticError
 from pyagnostics.spans import LabeledSpan, SourceSpan
@@ -32,6 +35,18 @@ from pyhcl2.rich_utils import (
     Inline,
 )
 
+# Fixed punctuation shared by every value renderer
+_NULL = Segment("null", style=STYLE_KEYWORDS)
+_LBRACKET = Segment("[")
+_RBRACKET = Segment("]")
+_LBRACE = Segment("{")
+_RBRACE = Segment("}")
+_COMMA = Segment(", ")
+_ASSIGN = Segment(" = ")
+_LANGLE = Segment("<")
+_RANGLE = Segment(">")
+_INDIRECT = Segment(", indirect: ", style=STYLE_KEYWORDS)
+
 
 @dataclass(kw_only=True, frozen=True)
 class Value(ConsoleRenderable):
@@ -102,7 +117,7 @@ class Null(Value):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("null", style=STYLE_KEYWORDS)
+        yield _NULL
 
     def rich_highlights(self) -> Iterable[Span]:
         if self.span is not None:
@@ -223,6 +238,20 @@ class Integer(Value):
 class String(Value):
     _raw: str
 
+    @staticmethod
+    def intern(raw: str) -> String:
+        """Returns a shared, span-less String for the given raw value.
+
+        Used for the keys built while evaluating objects and attribute lookups,
+        so repeated keys share one instance and dict lookups can match on
+        identity. Strings that carry a span are never interned.
+        """
+        try:
+            return _INTERNED_STRINGS[raw]
+        except KeyError:
+            string = _INTERNED_STRINGS[raw] = String(raw)
+            return string
+
     def raw(self) -> str:
         return self._raw
 
@@ -257,6 +286,9 @@ class String(Value):
             yield self.span.styled(STYLE_STRING)
 
 
+_INTERNED_STRINGS: WeakValueDictionary[str, String] = WeakValueDictionary()
+
+
 @dataclass(eq=True, frozen=True)
 class Float(Value):
     _raw: float
@@ -468,13 +500,14 @@ class Array(Value, MutableSequence[Value]):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("[")
-        for i, item in enumerate(self._raw):
+        yield _LBRACKET
+        separator = None
+        for item in self._raw:
+            if separator is not None:
+                yield separator
+            separator = _COMMA
             yield item
-            if i < len(self._raw) - 1:
-                yield Segment(", ")
-
-        yield Segment("]")
+        yield _RBRACKET
 
 
 @dataclass(eq=True, frozen=True)
@@ -494,6 +527,19 @@ class Object(Value, MutableMapping[String, Value]):
     def __getitem__(self, key: String) -> Value:
         return self._raw[key]
 
+    def get_by_str(self, name: str) -> Value | None:
+        """Looks up a field by its raw name, returning None if it is not set."""
+        return self._raw.get(String.intern(name))
+
+    def items(self) -> ItemsView[String, Value]:
+        # The backing dict's view, instead of the generic mixin that goes
+        # through __iter__ and __getitem__ for every field
+        return self._raw.items()
+
+    def str_items(self) -> list[tuple[str, Value]]:
+        """The fields of this object keyed by their raw names."""
+        return [(key._raw, value) for key, value in self._raw.items()]
+
     def __delitem__(self, key: String) -> None:
         del self._raw[key]
 
@@ -519,18 +565,19 @@ class Object(Value, MutableMapping[String, Value]):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("{")
-        for i, (key, value) in enumerate(self._raw.items()):
-            yield Segment(key.raw(), style=STYLE_PROPERTY_NAME)
-            yield Segment(" = ")
+        yield _LBRACE
+        separator = None
+        for key, value in self._raw.items():
+            if separator is not None:
+                yield separator
+            separator = _COMMA
+            yield Segment(key._raw, style=STYLE_PROPERTY_NAME)
+            yield _ASSIGN
             yield value
-            if i < len(self._raw) - 1:
-                yield Segment(", ")
-
-        yield Segment("}")
+        yield _RBRACE
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class VariableReference:
     key: tuple[str | None, ...]
     span: SourceSpan
@@ -549,7 +596,7 @@ class Unknown(Value):
             labels=[
                 LabeledSpan(
                     ref.span,
-                    f"{ref.key[-1]} could not be resolved ({".".join([k if k else "?" for k in ref.key])})",
+                    f"{ref.key[-1]} could not be resolved ({'.'.join([k if k else '?' for k in ref.key])})",
                 )
                 for ref in self.references
             ],
@@ -558,73 +605,56 @@ class Unknown(Value):
     def raw(self) -> Never:
         self.raise_on_unknown()
 
-    @property
+    @cached_property
     def references(self) -> set[VariableReference]:
+        # Unknowns are immutable, so the union only needs building once even
+        # though every propagation step through indirect/direct reads it
         return self.direct_references | self.indirect_references
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        yield Segment("<")
+        yield _LANGLE
         yield Segment(
             "Unknown due to missing variables, direct: ", style=STYLE_KEYWORDS
         )
-        for i, ref in enumerate(self.direct_references):
-            for j, key in enumerate(ref.key):
-                yield Segment(key if key else "?")
-                if j < len(ref.key) - 1:
-                    yield Segment(".")
-            if i < len(self.direct_references) - 1:
-                yield Segment(", ")
-        yield Segment(", indirect: ", style=STYLE_KEYWORDS)
-        for i, ref in enumerate(self.indirect_references):
-            for j, key in enumerate(ref.key):
-                yield Segment(key if key else "?")
-                if j < len(ref.key) - 1:
-                    yield Segment(".")
-            if i < len(self.indirect_references) - 1:
-                yield Segment(", ")
-        yield Segment(">")
+        yield from self._render_references(self.direct_references)
+        yield _INDIRECT
+        yield from self._render_references(self.indirect_references)
+        yield _RANGLE
+
+    @staticmethod
+    def _render_references(references: Iterable[VariableReference]) -> RenderResult:
+        # One segment per dotted reference, separated by commas
+        separator = None
+        for ref in references:
+            if separator is not None:
+                yield separator
+            separator = _COMMA
+            yield Segment(".".join([key if key else "?" for key in ref.key]))
 
     def indirect(*values: Value) -> Unknown:
         resolved_values = [value.resolve() for value in values]
 
         return Unknown(
             set(),
-            set(
-                [
-                    ref
-                    for value in resolved_values
-                    if isinstance(value, Unknown)
-                    for ref in value.references
-                ]
-            ),
+            {
+                ref
+                for value in resolved_values
+                if isinstance(value, Unknown)
+                for ref in value.references
+            },
         )
 
     def direct(self, span: SourceSpan, key: str) -> Unknown:
         if self.direct_references:
-            direct_refs = set(
-                [
-                    VariableReference(
-                        (
-                            *ref.key,
-                            key,
-                        ),
-                        span,
-                    )
-                    for ref in self.direct_references
-                ]
-            )
-        else:
+            suffix = (key,)
             direct_refs = {
-                VariableReference(
-                    (
-                        None,
-                        key,
-                    ),
-                    span,
-                )
+                VariableReference(ref.key + suffix, span)
+                for ref in self.direct_references
             }
+        else:
+            direct_refs = {VariableReference((None, key), span)}
 
         return Unknown(direct_refs, self.references)
 
@@ -4,9 +4,9 @@ import pytest
 from pyagnostics.exceptions import DiagnosticError
 
 from pyhcl2.eval import EvaluationScope, Evaluator
-from pyhcl2.nodes import Attribute, Block, Identifier
+from pyhcl2.nodes import Attribute, Block, GetAttrKey, Identifier
 from pyhcl2.parse import parse_expr, parse_expr_or_stmt
-from pyhcl2.values import Integer, Value
+from pyhcl2.values import Array, Integer, Value
 
 
 def eval_hcl(expr: str, **kwargs: object) -> object:
@@ -58,6 +58,17 @@ def test_eval_identifier_parent_scope() -> None:
     )
 
 
+def test_scope_contains() -> None:
+    scope = EvaluationScope(parent=EvaluationScope(variables={"foo": Integer(42)}))
+    child = scope.child()
+    child["bar"] = Integer(1)
+
+    assert "foo" in child
+    assert "bar" in child
+    assert "bar" not in scope
+    assert "baz" not in child
+
+
 def test_eval_unary_expr() -> None:
     assert eval_hcl("-42") == -42
     assert eval_hcl("!true") is False
@@ -112,10 +123,24 @@ def test_eval_array() -> None:
     assert eval_hcl("[1, 2, 3, 4]") == [1, 2, 3, 4]
 
 
+def test_eval_literal_array_is_not_shared() -> None:
+    evaluator = Evaluator()
+    expr = parse_expr("[1, 2]")
+    first = evaluator.eval(expr)
+    assert isinstance(first, Array)
+    first.append(Integer(3))
+    assert evaluator.eval(expr).raw() == [1, 2]
+
+
 def test_eval_object() -> None:
     assert eval_hcl('{ foo = "bar" }') == {"foo": "bar"}
     assert eval_hcl('{ foo: "bar" }') == {"foo": "bar"}
     assert eval_hcl('{ (foo): "bar"}.baz', foo="baz") == "bar"
+    assert eval_hcl('{ a = b, "c" = 1, (d) = 2 }', b=0, d="e") == {
+        "a": 0,
+        "c": 1,
+        "e": 2,
+    }
 
 
 def test_eval_function_call() -> None:
@@ -242,3 +267,10 @@ def test_eval_nested_block() -> None:
     )
 
     assert result.raw() == {"nested": [{"a": 1}, {"a": 2}]}
+
+
+def test_eval_unsupported_node() -> None:
+    with pytest.raises(DiagnosticError) as exc_info:
+        Evaluator().eval(GetAttrKey(Identifier("a")))
+
+    assert exc_info.value.code == "pyhcl2::evaluator::unsupported_node"
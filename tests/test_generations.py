@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from pyhcl2.generations import get_blocks_by_generation
+from pyhcl2.parse import parse_module
+
+
+def test_get_blocks_by_generation() -> None:
+    module = parse_module(
+        """
+        resource "a" { x = 1 }
+        resource "b" { y = resource.a.x }
+        resource "c" { z = resource.b.y + resource.a.x }
+        resource "d" { w = 2 }
+        """
+    )
+
+    generations = [
+        [block.key() for block in generation]
+        for generation in get_blocks_by_generation(module, "resource")
+    ]
+
+    assert generations == [
+        [("resource", "a"), ("resource", "d")],
+        [("resource", "b")],
+        [("resource", "c")],
+    ]
+
+    reversed_generations = get_blocks_by_generation(module, "resource", reverse=True)
+    assert [block.key() for block in reversed_generations[0]] == [("resource", "c")]
+
+
+def test_get_blocks_by_generation_cycle() -> None:
+    module = parse_module(
+        """
+        resource "a" { x = resource.b.y }
+        resource "b" { y = resource.a.x }
+        """
+    )
+
+    with pytest.raises(ValueError, match="not a DAG"):
+        get_blocks_by_generation(module, "resource")
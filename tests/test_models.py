@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from pyagnostics.exceptions import DiagnosticError, DiagnosticErrorGroup
+from pydantic import BaseModel, Field
+
+from pyhcl2.models import load_model_from_block
+from pyhcl2.nodes import Block
+from pyhcl2.parse import parse_expr_or_stmt
+from pyhcl2.values import Integer, Value
+
+
+class ExampleModel(BaseModel):
+    name: str
+    values: list[int] = Field(min_length=2)
+
+
+def parse_block(text: str) -> Block:
+    block = parse_expr_or_stmt(text)
+    assert isinstance(block, Block)
+    return block
+
+
+def test_load_model_from_block() -> None:
+    model = load_model_from_block(
+        parse_block('test {\nname = "test"\nvalues = [1, 2]\nextra = 3\n}'),
+        ExampleModel,
+    )
+
+    assert model == ExampleModel(name="test", values=[1, 2])
+
+
+def test_load_model_from_block_value_field() -> None:
+    class ValueModel(BaseModel):
+        value: Value
+
+    model = load_model_from_block(parse_block("test {\nvalue = 1\n}"), ValueModel)
+
+    assert isinstance(model.value, Integer)
+    assert model.value.raw() == 1
+
+
+def test_load_model_from_block_validation_errors() -> None:
+    with pytest.raises(DiagnosticErrorGroup) as exc_info:
+        load_model_from_block(parse_block("test {\nvalues = [1]\n}"), ExampleModel)
+
+    errors = exc_info.value.exceptions
+    assert len(errors) == 2
+    assert all(isinstance(error, DiagnosticError) for error in errors)
+    assert errors[0].message == "Missing required field test.name"
+    validation_error = errors[1]
+    assert isinstance(validation_error, DiagnosticError)
+    assert validation_error.code == "pyhcl2::pydantic_validation_error::too_short"
+    assert [label.span.start for label in validation_error.labels] == [16]
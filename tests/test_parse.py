@@ -1,6 +1,8 @@
+import pickle
 import textwrap
 
 import pytest
+from lark import UnexpectedToken
 from pyagnostics.exceptions import DiagnosticError
 from pyagnostics.spans import SourceSpan
 
@@ -29,6 +31,7 @@ from pyhcl2.nodes import (
     UnaryOperator,
 )
 from pyhcl2.parse import (
+    _lark,
     parse_expr,
     parse_expr_or_stmt,
     parse_module,
@@ -57,6 +60,11 @@ def test_parse_literal_number() -> None:
     assert parse_expr("42.42") == Literal(Float(42.42), span=SourceSpan(0, 5))
 
 
+def test_parse_heredoc_trim() -> None:
+    expr = parse_expr("<<-EOT\n    hello\n      world\n    EOT\n")
+    assert expr == Literal(String('"hello\n  world"'), span=SourceSpan(0, 36))
+
+
 def test_parse_identifier() -> None:
     assert parse_expr("foo") == Identifier("foo", span=SourceSpan(0, 3))
     assert parse_expr("bar") == Identifier("bar", span=SourceSpan(0, 3))
@@ -321,41 +329,48 @@ def test_parse_array_complex() -> None:
 
 def test_parse_object() -> None:
     assert parse_expr('{ foo = "bar" }') == ObjectExpression(
-        {
-            Identifier("foo", span=SourceSpan(2, 5)): Literal(
-                String("bar"), span=SourceSpan(8, 13)
+        [
+            (
+                Identifier("foo", span=SourceSpan(2, 5)),
+                Literal(String("bar"), span=SourceSpan(8, 13)),
             )
-        },
+        ],
         span=SourceSpan(0, 15),
     )
     assert parse_expr("{ foo: bar }") == ObjectExpression(
-        {
-            Identifier("foo", span=SourceSpan(2, 5)): Identifier(
-                "bar", span=SourceSpan(7, 10)
+        [
+            (
+                Identifier("foo", span=SourceSpan(2, 5)),
+                Identifier("bar", span=SourceSpan(7, 10)),
             )
-        },
+        ],
         span=SourceSpan(0, 12),
     )
 
 
 def test_parse_object_complex() -> None:
     assert parse_expr("{ (foo) = bar }") == ObjectExpression(
-        {
-            Parenthesis(
-                Identifier("foo", span=SourceSpan(3, 6)), span=SourceSpan(2, 7)
-            ): Identifier("bar", span=SourceSpan(10, 13))
-        },
+        [
+            (
+                Parenthesis(
+                    Identifier("foo", span=SourceSpan(3, 6)), span=SourceSpan(2, 7)
+                ),
+                Identifier("bar", span=SourceSpan(10, 13)),
+            )
+        ],
         span=SourceSpan(0, 15),
     )
     assert parse_expr('{ foo = "bar", baz = 42 }') == ObjectExpression(
-        {
-            Identifier("foo", span=SourceSpan(2, 5)): Literal(
-                String("bar"), span=SourceSpan(8, 13)
+        [
+            (
+                Identifier("foo", span=SourceSpan(2, 5)),
+                Literal(String("bar"), span=SourceSpan(8, 13)),
             ),
-            Identifier("baz", span=SourceSpan(15, 18)): Literal(
-                Integer(42), span=SourceSpan(21, 23)
+            (
+                Identifier("baz", span=SourceSpan(15, 18)),
+                Literal(Integer(42), span=SourceSpan(21, 23)),
             ),
-        },
+        ],
         span=SourceSpan(0, 25),
     )
 
@@ -363,38 +378,59 @@ def test_parse_object_complex() -> None:
         parse_expr("{ for = 1, baz = 2 }")
 
     assert parse_expr('{ "for" = 1, baz = 2}') == ObjectExpression(
-        {
-            Literal(String("for"), span=SourceSpan(2, 7)): Literal(
-                Integer(1), span=SourceSpan(10, 11)
+        [
+            (
+                Literal(String("for"), span=SourceSpan(2, 7)),
+                Literal(Integer(1), span=SourceSpan(10, 11)),
             ),
-            Identifier("baz", span=SourceSpan(13, 16)): Literal(
-                Integer(2), span=SourceSpan(19, 20)
+            (
+                Identifier("baz", span=SourceSpan(13, 16)),
+                Literal(Integer(2), span=SourceSpan(19, 20)),
             ),
-        },
+        ],
         span=SourceSpan(0, 21),
     )
     assert parse_expr("{ baz = 2, for = 1}") == ObjectExpression(
-        {
-            Identifier("baz", span=SourceSpan(2, 5)): Literal(
-                Integer(2), span=SourceSpan(8, 9)
+        [
+            (
+                Identifier("baz", span=SourceSpan(2, 5)),
+                Literal(Integer(2), span=SourceSpan(8, 9)),
             ),
-            Identifier("for", span=SourceSpan(11, 14)): Literal(
-                Integer(1), span=SourceSpan(17, 18)
+            (
+                Identifier("for", span=SourceSpan(11, 14)),
+                Literal(Integer(1), span=SourceSpan(17, 18)),
             ),
-        },
+        ],
         span=SourceSpan(0, 19),
     )
     assert parse_expr("{ (for) = 1, baz = 2}") == ObjectExpression(
-        {
-            Parenthesis(
-                Identifier("for", span=SourceSpan(3, 6)), span=SourceSpan(2, 7)
-            ): Literal(Integer(1), span=SourceSpan(10, 11)),
-            Identifier("baz", span=SourceSpan(13, 16)): Literal(
-                Integer(2), span=SourceSpan(19, 20)
+        [
+            (
+                Parenthesis(
+                    Identifier("for", span=SourceSpan(3, 6)), span=SourceSpan(2, 7)
+                ),
+                Literal(Integer(1), span=SourceSpan(10, 11)),
             ),
-        },
+            (
+                Identifier("baz", span=SourceSpan(13, 16)),
+                Literal(Integer(2), span=SourceSpan(19, 20)),
+            ),
+        ],
         span=SourceSpan(0, 21),
     )
+    assert parse_expr("{ a = 1, a = 2 }") == ObjectExpression(
+        [
+            (
+                Identifier("a", span=SourceSpan(2, 3)),
+                Literal(Integer(1), span=SourceSpan(6, 7)),
+            ),
+            (
+                Identifier("a", span=SourceSpan(9, 10)),
+                Literal(Integer(2), span=SourceSpan(13, 14)),
+            ),
+        ],
+        span=SourceSpan(0, 16),
+    )
 
 
 def test_parse_function_call() -> None:
@@ -445,43 +481,47 @@ def test_parse_get_index() -> None:
 
 def test_parse_get_attr_splat() -> None:
     assert parse_expr("foo.*") == AttrSplat(
-        Identifier("foo", span=SourceSpan(0, 3)), [], span=SourceSpan(0, 5)
+        Identifier("foo", span=SourceSpan(0, 3)), (), span=SourceSpan(0, 5)
     )
     assert parse_expr("foo.*.bar") == AttrSplat(
         Identifier("foo", span=SourceSpan(0, 3)),
-        [GetAttrKey(Identifier("bar", span=SourceSpan(6, 9)), span=SourceSpan(5, 9))],
+        (GetAttrKey(Identifier("bar", span=SourceSpan(6, 9)), span=SourceSpan(5, 9)),),
         span=SourceSpan(0, 9),
     )
 
 
 def test_parse_index_splat() -> None:
     assert parse_expr("foo[*]") == IndexSplat(
-        Identifier("foo", span=SourceSpan(0, 3)), [], span=SourceSpan(0, 6)
+        Identifier("foo", span=SourceSpan(0, 3)), (), span=SourceSpan(0, 6)
     )
     assert parse_expr("foo[*].bar") == IndexSplat(
         Identifier("foo", span=SourceSpan(0, 3)),
-        [GetAttrKey(Identifier("bar", span=SourceSpan(7, 10)), span=SourceSpan(6, 10))],
+        (
+            GetAttrKey(
+                Identifier("bar", span=SourceSpan(7, 10)), span=SourceSpan(6, 10)
+            ),
+        ),
         span=SourceSpan(0, 10),
     )
     assert parse_expr("foo[*][3]") == IndexSplat(
         Identifier("foo", span=SourceSpan(0, 3)),
-        [
+        (
             GetIndexKey(
                 Literal(Integer(3), span=SourceSpan(7, 8)), span=SourceSpan(6, 9)
-            )
-        ],
+            ),
+        ),
         span=SourceSpan(0, 9),
     )
     assert parse_expr("foo[*].bar[3]") == IndexSplat(
         Identifier("foo", span=SourceSpan(0, 3)),
-        [
+        (
             GetAttrKey(
                 Identifier("bar", span=SourceSpan(7, 10)), span=SourceSpan(6, 10)
             ),
             GetIndexKey(
                 Literal(Integer(3), span=SourceSpan(11, 12)), span=SourceSpan(10, 13)
             ),
-        ],
+        ),
         span=SourceSpan(0, 13),
     )
 
@@ -730,3 +770,97 @@ def test_parse_multiple_blocks() -> None:
             ),
         ],
     )
+
+
+@pytest.mark.parametrize("text", ["", "\n", "\n\n", "# comment\n"])
+def test_parse_empty_module(text: str) -> None:
+    assert parse_module(text) == Module([], span=SourceSpan(0, len(text)))
+
+
+def test_parse_empty_expr() -> None:
+    with pytest.raises(DiagnosticError) as exc_info:
+        parse_expr("")
+
+    assert exc_info.value.code == "pyhcl2::parser::unexpected_eof"
+    assert isinstance(exc_info.value.__cause__, UnexpectedToken)
+
+
+def test_module_get_block() -> None:
+    module = parse_module(
+        textwrap.dedent("""
+        resource "a" {
+            value = 1
+        }
+        resource "b" {
+            value = 2
+        }
+        other {
+            value = 3
+        }
+        """).strip()
+    )
+
+    block = module.get_block("resource", "b")
+    assert block is not None
+    assert block.key_path == ("resource", "b")
+    assert module.get_block("resource", "c") is None
+    assert module.get_block("other") is not None
+
+    with pytest.raises(ValueError, match="Multiple resource blocks"):
+        module.get_block("resource")
+
+
+def test_nodes_have_no_instance_dict() -> None:
+    block = parse_expr_or_stmt('resource "a" b {\nc = [d, 1]\n}')
+    assert isinstance(block, Block)
+
+    assert block.key_path == ("resource", "a", "b")
+    assert not hasattr(block, "__dict__")
+    assert not hasattr(block.body[0], "__dict__")
+
+
+def test_node_hash_is_cached() -> None:
+    expr = parse_expr("{a = 1}")
+    assert isinstance(expr, ObjectExpression)
+
+    key, value = expr.fields[0]
+    assert hash(key) == hash(key) == hash(Identifier("a"))
+    assert key._cache["_hash"] == hash(key)
+    assert value == Literal(Integer(1))
+
+
+def test_pickled_node_drops_cache() -> None:
+    ident = Identifier("a")
+    hash(ident)
+    assert "_hash" in ident._cache
+
+    loaded = pickle.loads(pickle.dumps(ident))
+    assert loaded == ident
+    assert not hasattr(loaded, "_cache")
+
+
+def test_block_key_path_is_cached() -> None:
+    block = parse_expr_or_stmt('resource "a" b {}')
+    assert isinstance(block, Block)
+
+    assert block.key_path == ("resource", "a", "b")
+    assert block.key_path is block.key_path
+    assert block.keys is block.keys
+
+
+def test_module_get_block_mixed_labels() -> None:
+    module = parse_module('resource a "b" {}\nresource a "c" {}')
+
+    block = module.get_block("resource", "a", "c")
+    assert block is not None
+    assert block.key_path == ("resource", "a", "c")
+    assert module.get_block("resource", "a") is None
+    assert len(module.get_blocks("resource")) == 2
+
+
+def test_parser_is_loaded_once_per_start_symbol() -> None:
+    parse_expr("1")
+    parse_expr("2")
+
+    assert _lark("start_expr") is _lark("start_expr")
+    assert _lark("start_expr") is not _lark("start")
@@ -0,0 +1,24 @@
+from pyagnostics.source import InMemorySource
+from pyagnostics.spans import SourceSpan
+
+from pyhcl2.parse import parse_module
+from pyhcl2.rich_utils import HclHighlighter
+
+
+def test_highlighter_only_applies_overlapping_spans() -> None:
+    text = 'a = f(1)\nb = "x"\nc = [for v in d: v]'
+    highlighter = HclHighlighter(parse_module(text))
+    contents = InMemorySource(text).read_span(SourceSpan(9, 16))
+    window = contents.span
+
+    highlighter.highlight(contents)
+
+    expected = [
+        (span.start - window.start, span.end - window.start, span.style)
+        for span in highlighter.ast.rich_highlights()
+        if span.start < window.end and span.end > window.start
+    ]
+    assert expected
+    assert [
+        (span.start, span.end, span.style) for span in contents.text.spans
+    ] == expected